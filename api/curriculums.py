@@ -52,8 +52,8 @@ def create_curriculum_with_file(
     _auth=Depends(require_authentication)
 ):
     # Validate job exists
-    job = db.exec(select(Jobs).filter(Jobs.JobId == job_id)).first()
-    if not job:
+    job_exists = db.exec(select(Jobs.JobId).filter(Jobs.JobId == job_id)).first()
+    if job_exists is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
     # Validate file type
@@ -95,8 +95,8 @@ def create_curriculum(
     _auth=Depends(require_authentication)
 ):
     # Validate job exists
-    job = db.exec(select(Jobs).filter(Jobs.JobId == curriculum.JobId)).first()
-    if not job:
+    job_exists = db.exec(select(Jobs.JobId).filter(Jobs.JobId == curriculum.JobId)).first()
+    if job_exists is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
     db_curriculum = Curriculums(**curriculum.model_dump())
@@ -201,7 +201,7 @@ async def require_authentication(
     return token_data
 
 
-async def get_current_employee(
+def get_current_employee(
     token_data: dict = Depends(require_authentication),
     db: Session = Depends(get_db),
 ) -> Employees:
@@ -238,7 +238,7 @@ async def get_current_employee(
     return employee
 
 
-async def get_current_employee_with_permissions(
+def get_current_employee_with_permissions(
     employee: Employees = Depends(get_current_employee),
     db: Session = Depends(get_db),
 ) -> dict:
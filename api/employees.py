@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Response
+from pydantic import TypeAdapter
 from sqlmodel import Session, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from typing import List, Optional
 from datetime import datetime
 
@@ -10,9 +11,13 @@ from models.employees import Employees, Roles, EmployeeRoles
 from models.countries import Countries
 from schemas.employees import Employee, EmployeeUpdate, EmployeeRoleAssignment, EmployeeRole
 from core.microsoft_graph import graph_client
+from core.cache import get_country_id, get_country_names
 
 router = APIRouter()
 
+# Built once; list responses are dumped in a single call instead of being re-validated
+_employee_list_adapter = TypeAdapter(List[Employee])
+
 def normalize_country_to_code(country_name: str) -> Optional[str]:
     """
     Convert country names or codes to standard ISO 3166-1 alpha-2 codes.
@@ -74,22 +79,28 @@ async def get_or_create_country_id(db: Session, country_input: str) -> tuple[Opt
         return None, False
 
     # Try to find existing country by code
-    existing_country = db.exec(
-        select(Countries).filter(Countries.Name == country_code)
-    ).first()
-
-    if existing_country:
-        return existing_country.CountryId, False
+    existing_country_id = get_country_id(db, country_code)
+    if existing_country_id is not None:
+        return existing_country_id, False
 
     # Create new country with ISO code
+    # Flush only: the caller's commit (or rollback) covers the new country
     new_country = Countries(Name=country_code)
     db.add(new_country)
-    db.commit()
-    db.refresh(new_country)
+    db.flush()
     return new_country.CountryId, True
 
-def employee_to_schema(db_employee: Employees) -> Employee:
-    """Convert Employees model to Employee schema with computed country_name and roles."""
+def employee_to_schema(db_employee: Employees, country_names: Optional[dict[int, str]] = None) -> Employee:
+    """Convert Employees model to Employee schema with computed country_name and roles.
+
+    country_names (CountryId -> Name) lets list endpoints resolve country_name
+    from one lookup instead of the country relationship.
+    """
+    if country_names is not None:
+        country_name = country_names.get(db_employee.CountryId)
+    else:
+        country_name = db_employee.country.Name if db_employee.country else None
+
     roles = [
         EmployeeRole(
             RoleId=role.RoleId,
@@ -119,7 +130,7 @@ def employee_to_schema(db_employee: Employees) -> Employee:
         AzureOid=db_employee.AzureOid,
         AzureUpn=db_employee.AzureUpn,
         LastSyncedAt=db_employee.LastSyncedAt,
-        country_name=db_employee.country.Name if db_employee.country else None,
+        country_name=country_name,
         roles=roles
     )
 
@@ -128,15 +139,29 @@ def employee_to_schema(db_employee: Employees) -> Employee:
 # ----------------------------
 @router.get("/", response_model=List[Employee])
 def get_employees(
+    # Pagination
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of records to return (all when omitted)"),
+
     db: Session = Depends(get_db),
     _auth=Depends(require_authentication)
 ):
     employees = db.exec(
         select(Employees)
-        .join(Countries, isouter=True)
-        .options(selectinload(Employees.roles))
+        .options(selectinload(Employees.roles), raiseload("*"))
+        .order_by(Employees.EmployeeId)
+        .offset(skip)
+        .limit(limit)
     ).all()
-    return [employee_to_schema(emp) for emp in employees]
+
+    # Resolve every country name of the page from the cache (one IN query for misses)
+    country_ids = {emp.CountryId for emp in employees if emp.CountryId}
+    country_names = get_country_names(db, country_ids)
+
+    return Response(
+        content=_employee_list_adapter.dump_json([employee_to_schema(emp, country_names) for emp in employees]),
+        media_type="application/json"
+    )
 
 # ----------------------------
 # 📌 READ ONE
@@ -147,12 +172,11 @@ def get_employee(
     db: Session = Depends(get_db),
     _auth=Depends(require_authentication)
 ):
-    db_employee = db.exec(
-        select(Employees)
-        .join(Countries, isouter=True)
-        .options(selectinload(Employees.roles))
-        .filter(Employees.EmployeeId == employee_id)
-    ).first()
+    db_employee = db.get(
+        Employees,
+        employee_id,
+        options=[selectinload(Employees.roles)]
+    )
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     return employee_to_schema(db_employee)
@@ -171,7 +195,7 @@ async def update_employee(
     Update employee in local database and sync to Microsoft 365 if possible.
     Always attempts Microsoft sync, but continues if AzureOid is missing or sync fails.
     """
-    db_employee = db.exec(select(Employees).filter(Employees.EmployeeId == employee_id)).first()
+    db_employee = db.get(Employees, employee_id)
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
@@ -210,7 +234,7 @@ async def update_employee(
 # 📌 EMPLOYEE ROLES MANAGEMENT
 # ----------------------------
 @router.post("/{employee_id}/roles", response_model=Employee)
-async def assign_role_to_employee(
+def assign_role_to_employee(
     employee_id: int,
     role_assignment: EmployeeRoleAssignment,
     db: Session = Depends(get_db),
@@ -218,12 +242,12 @@ async def assign_role_to_employee(
 ):
     """Assign a role to an employee."""
     # Check if employee exists
-    db_employee = db.exec(select(Employees).filter(Employees.EmployeeId == employee_id)).first()
+    db_employee = db.get(Employees, employee_id)
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
     # Check if role exists
-    db_role = db.exec(select(Roles).filter(Roles.RoleId == role_assignment.RoleId)).first()
+    db_role = db.get(Roles, role_assignment.RoleId)
     if not db_role:
         raise HTTPException(status_code=404, detail="Role not found")
 
@@ -246,7 +270,7 @@ async def assign_role_to_employee(
     return get_employee(employee_id, db, _auth)
 
 @router.delete("/{employee_id}/roles/{role_id}", response_model=Employee)
-async def remove_role_from_employee(
+def remove_role_from_employee(
     employee_id: int,
     role_id: int,
     db: Session = Depends(get_db),
@@ -271,14 +295,14 @@ async def remove_role_from_employee(
     return get_employee(employee_id, db, _auth)
 
 @router.get("/{employee_id}/roles", response_model=List[EmployeeRole])
-async def get_employee_roles(
+def get_employee_roles(
     employee_id: int,
     db: Session = Depends(get_db),
     _auth=Depends(require_authentication)
 ):
     """Get all roles for a specific employee."""
     # Check if employee exists
-    db_employee = db.exec(select(Employees).filter(Employees.EmployeeId == employee_id)).first()
+    db_employee = db.get(Employees, employee_id)
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
@@ -372,7 +396,7 @@ async def sync_employee_to_microsoft(
     Sync a specific employee from local database to Microsoft 365.
     Requires employee to have AzureOid.
     """
-    db_employee = db.exec(select(Employees).filter(Employees.EmployeeId == employee_id)).first()
+    db_employee = db.get(Employees, employee_id)
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
@@ -422,7 +446,7 @@ async def sync_single_employee_from_microsoft(
     Fetch and sync a single employee from Microsoft 365 by their AzureOid.
     Updates local database with Microsoft data.
     """
-    db_employee = db.exec(select(Employees).filter(Employees.EmployeeId == employee_id)).first()
+    db_employee = db.get(Employees, employee_id)
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session, select, update, delete
+from typing import List, Optional
 
 from api.dependencies import require_authentication
 from bd.dependencies import get_db
@@ -29,10 +29,19 @@ def create_license(
 # ----------------------------
 @router.get("/", response_model=List[License])
 def get_licenses(
+    # Pagination
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of records to return (all when omitted)"),
+
     db: Session = Depends(get_db),
     _auth=Depends(require_authentication)
 ):
-    return db.exec(select(Licenses)).all()
+    return db.exec(
+        select(Licenses)
+        .order_by(Licenses.LicenseId)
+        .offset(skip)
+        .limit(limit)
+    ).all()
 
 # ----------------------------
 # 📌 READ ONE
@@ -43,7 +52,7 @@ def get_license(
     db: Session = Depends(get_db),
     _auth=Depends(require_authentication)
 ):
-    db_license = db.exec(select(Licenses).filter(Licenses.LicenseId == license_id)).first()
+    db_license = db.get(Licenses, license_id)
     if not db_license:
         raise HTTPException(status_code=404, detail="License not found")
     return db_license
@@ -58,15 +67,17 @@ def update_license(
     db: Session = Depends(get_db),
     _auth=Depends(require_authentication)
 ):
-    db_license = db.exec(select(Licenses).filter(Licenses.LicenseId == license_id)).first()
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+    db_license = db.exec(
+        update(Licenses)
+        .where(Licenses.LicenseId == license_id)
+        .values(**license.model_dump())
+        .returning(Licenses)
+    ).scalars().first()
     if not db_license:
         raise HTTPException(status_code=404, detail="License not found")
 
-    for key, value in license.model_dump().items():
-        setattr(db_license, key, value)
-
     db.commit()
-    db.refresh(db_license)
     return db_license
 
 # ----------------------------
@@ -78,10 +89,9 @@ def delete_license(
     db: Session = Depends(get_db),
     _auth=Depends(require_authentication)
 ):
-    db_license = db.exec(select(Licenses).filter(Licenses.LicenseId == license_id)).first()
-    if not db_license:
+    result = db.exec(delete(Licenses).where(Licenses.LicenseId == license_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="License not found")
 
-    db.delete(db_license)
     db.commit()
     return {"message": "License deleted successfully"}
\ No newline at end of file
@@ -5,7 +5,7 @@ from typing import List
 from api.dependencies import require_authentication
 from bd.dependencies import get_db
 from models.modules import Modules
-from schemas.modules import Module, ModuleCreate, ModuleUpdate
+from schemas.modules import Module, ModuleCreate, ModuleUpdate, ModuleTree
 
 router = APIRouter()
 
@@ -13,7 +13,7 @@ router = APIRouter()
 # 📌 CREATE MODULE
 # ----------------------------
 @router.post("/", response_model=Module)
-async def create_module(
+def create_module(
     module: ModuleCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -40,7 +40,7 @@ async def create_module(
 # 📌 READ ALL MODULES
 # ----------------------------
 @router.get("/", response_model=List[Module])
-async def get_modules(
+def get_modules(
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -56,7 +56,7 @@ async def get_modules(
 # 📌 READ ONE MODULE
 # ----------------------------
 @router.get("/{module_id}", response_model=Module)
-async def get_module(
+def get_module(
     module_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -71,7 +71,7 @@ async def get_module(
 # 📌 GET MODULE BY KEY
 # ----------------------------
 @router.get("/by-key/{module_key}", response_model=Module)
-async def get_module_by_key(
+def get_module_by_key(
     module_key: str,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -86,7 +86,7 @@ async def get_module_by_key(
 # 📌 GET CHILD MODULES
 # ----------------------------
 @router.get("/{module_id}/children", response_model=List[Module])
-async def get_child_modules(
+def get_child_modules(
     module_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -102,7 +102,7 @@ async def get_child_modules(
 # 📌 GET ROOT MODULES
 # ----------------------------
 @router.get("/root/all", response_model=List[Module])
-async def get_root_modules(
+def get_root_modules(
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
 ):
@@ -113,11 +113,33 @@ async def get_root_modules(
     ).order_by(Modules.DisplayOrder, Modules.ModuleName)
     return db.exec(query).all()
 
+# ----------------------------
+# 📌 GET MODULE TREE
+# ----------------------------
+@router.get("/tree/all", response_model=List[ModuleTree])
+def get_module_tree(
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(require_authentication)
+):
+    """Get the active module hierarchy, loaded in a single query."""
+    query = select(Modules).where(Modules.IsActive == True).order_by(Modules.DisplayOrder, Modules.ModuleName)
+    nodes = {m.ModuleId: ModuleTree.model_validate(m) for m in db.exec(query).all()}
+
+    # Attach each module to its parent; modules whose parent is missing/inactive become roots
+    roots = []
+    for node in nodes.values():
+        parent = nodes.get(node.ParentModuleId)
+        if parent:
+            parent.children.append(node)
+        else:
+            roots.append(node)
+    return roots
+
 # ----------------------------
 # 📌 UPDATE MODULE
 # ----------------------------
 @router.put("/{module_id}", response_model=Module)
-async def update_module(
+def update_module(
     module_id: int,
     module: ModuleUpdate,
     db: Session = Depends(get_db),
@@ -153,7 +175,7 @@ async def update_module(
 # 📌 DELETE MODULE
 # ----------------------------
 @router.delete("/{module_id}")
-async def delete_module(
+def delete_module(
     module_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -179,7 +201,7 @@ async def delete_module(
 # 📌 TOGGLE MODULE ACTIVE STATUS
 # ----------------------------
 @router.patch("/{module_id}/toggle-active", response_model=Module)
-async def toggle_module_active(
+def toggle_module_active(
     module_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import text
+from sqlmodel import Session, select, insert, delete
 from typing import List
 
 from api.dependencies import require_authentication, get_current_employee_with_permissions
@@ -17,11 +18,49 @@ from schemas.modules import (
 
 router = APIRouter()
 
+PERMISSION_FLAGS = ("CanView", "CanCreate", "CanEdit", "CanDelete", "CanExport", "AdminActions", "OtherActions")
+
+def normalize_role_permissions(role_id: int, permissions: List[PermissionCreate]) -> List[dict]:
+    """Permission rows for one role: one row per ModuleId (the last entry wins), all with the given RoleId"""
+    rows = {permission.ModuleId: {**permission.model_dump(), "RoleId": role_id} for permission in permissions}
+    return list(rows.values())
+
+def merge_role_permissions(db: Session, role_id: int, rows: List[dict]) -> None:
+    """Replace a role's permissions with a single MERGE from a staged temp table (SQL Server)"""
+    columns = ("ModuleId",) + PERMISSION_FLAGS
+
+    # Staging the rows keeps the MERGE itself at one parameter, however many modules the role has;
+    # fast_executemany sends the staging INSERT in one round-trip
+    db.exec(text(
+        "CREATE TABLE #RolePermissions (ModuleId int NOT NULL PRIMARY KEY, "
+        + ", ".join(f"{flag} bit NOT NULL" for flag in PERMISSION_FLAGS) + ")"
+    ))
+    if rows:
+        db.exec(
+            text(
+                f"INSERT INTO #RolePermissions ({', '.join(columns)}) "
+                f"VALUES ({', '.join(f':{column}' for column in columns)})"
+            ),
+            params=[{column: row[column] for column in columns} for row in rows],
+        )
+
+    db.exec(text(
+        "MERGE dbo.RoleModules AS t "
+        "USING #RolePermissions AS s "
+        "ON t.RoleId = :RoleId AND t.ModuleId = s.ModuleId "
+        f"WHEN MATCHED THEN UPDATE SET {', '.join(f't.{flag} = s.{flag}' for flag in PERMISSION_FLAGS)} "
+        f"WHEN NOT MATCHED BY TARGET THEN INSERT (RoleId, {', '.join(columns)}) "
+        f"VALUES (:RoleId, {', '.join(f's.{column}' for column in columns)}) "
+        "WHEN NOT MATCHED BY SOURCE AND t.RoleId = :RoleId THEN DELETE;"
+    ), params={"RoleId": role_id})
+    # Created inside the transaction, so a rollback on error removes it as well
+    db.exec(text("DROP TABLE #RolePermissions"))
+
 # ----------------------------
 # 📌 CREATE PERMISSION
 # ----------------------------
 @router.post("/", response_model=Permission)
-async def create_permission(
+def create_permission(
     permission: PermissionCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -60,7 +99,7 @@ async def create_permission(
 # 📌 READ ALL PERMISSIONS
 # ----------------------------
 @router.get("/", response_model=List[PermissionWithDetails])
-async def get_all_permissions(
+def get_all_permissions(
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
 ):
@@ -99,7 +138,7 @@ async def get_all_permissions(
 # 📌 GET PERMISSIONS BY ROLE
 # ----------------------------
 @router.get("/role/{role_id}", response_model=RolePermissionsResponse)
-async def get_role_permissions(
+def get_role_permissions(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -148,7 +187,7 @@ async def get_role_permissions(
 # 📌 GET PERMISSIONS BY MODULE
 # ----------------------------
 @router.get("/module/{module_id}", response_model=List[PermissionWithDetails])
-async def get_module_permissions(
+def get_module_permissions(
     module_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -193,7 +232,7 @@ async def get_module_permissions(
 # 📌 GET SPECIFIC PERMISSION
 # ----------------------------
 @router.get("/{role_id}/{module_id}", response_model=Permission)
-async def get_permission(
+def get_permission(
     role_id: int,
     module_id: int,
     db: Session = Depends(get_db),
@@ -219,7 +258,7 @@ async def get_permission(
 # 📌 UPDATE PERMISSION
 # ----------------------------
 @router.put("/{role_id}/{module_id}", response_model=Permission)
-async def update_permission(
+def update_permission(
     role_id: int,
     module_id: int,
     permission: PermissionUpdate,
@@ -251,7 +290,7 @@ async def update_permission(
 # 📌 DELETE PERMISSION
 # ----------------------------
 @router.delete("/{role_id}/{module_id}")
-async def delete_permission(
+def delete_permission(
     role_id: int,
     module_id: int,
     db: Session = Depends(get_db),
@@ -279,7 +318,7 @@ async def delete_permission(
 # 📌 BULK UPDATE PERMISSIONS FOR A ROLE
 # ----------------------------
 @router.post("/bulk-update", response_model=RolePermissionsResponse)
-async def bulk_update_permissions(
+def bulk_update_permissions(
     bulk_update: BulkPermissionUpdate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -293,34 +332,36 @@ async def bulk_update_permissions(
     if not role:
         raise HTTPException(status_code=404, detail=f"Role with ID {bulk_update.RoleId} not found")
     
-    # Delete existing permissions for this role
-    existing_permissions = db.exec(
-        select(RoleModules).where(RoleModules.RoleId == bulk_update.RoleId)
-    ).all()
-    for perm in existing_permissions:
-        db.delete(perm)
+    # Both paths below write the same rows: duplicates collapsed, RoleId taken from the request
+    rows = normalize_role_permissions(bulk_update.RoleId, bulk_update.permissions)
+
+    # Validate all modules exist with a single query
+    module_ids = {row["ModuleId"] for row in rows}
+    existing_module_ids = set(
+        db.exec(select(Modules.ModuleId).where(Modules.ModuleId.in_(module_ids))).all()
+    ) if module_ids else set()
+    for row in rows:
+        if row["ModuleId"] not in existing_module_ids:
+            raise HTTPException(status_code=404, detail=f"Module with ID {row['ModuleId']} not found")
     
-    # Create new permissions
-    for permission in bulk_update.permissions:
-        # Validate module exists
-        module = db.exec(select(Modules).where(Modules.ModuleId == permission.ModuleId)).first()
-        if not module:
-            db.rollback()
-            raise HTTPException(status_code=404, detail=f"Module with ID {permission.ModuleId} not found")
-        
-        db_permission = RoleModules(**permission.model_dump())
-        db.add(db_permission)
+    # Replace existing permissions
+    if db.get_bind().dialect.name == "mssql":
+        merge_role_permissions(db, bulk_update.RoleId, rows)
+    else:
+        db.exec(delete(RoleModules).where(RoleModules.RoleId == bulk_update.RoleId))
+        if rows:
+            db.exec(insert(RoleModules), params=rows)
     
     db.commit()
     
     # Return updated permissions
-    return await get_role_permissions(bulk_update.RoleId, db, current_user)
+    return get_role_permissions(bulk_update.RoleId, db, current_user)
 
 # ----------------------------
 # 📌 CHECK USER PERMISSION
 # ----------------------------
 @router.get("/check/{module_key}/{action}")
-async def check_user_permission(
+def check_user_permission(
     module_key: str,
     action: str,
     db: Session = Depends(get_db),
@@ -13,7 +13,7 @@ router = APIRouter()
 # 📌 CREATE ROLE
 # ----------------------------
 @router.post("/", response_model=Role)
-async def create_role(
+def create_role(
     role: RoleCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -29,7 +29,7 @@ async def create_role(
 # 📌 READ ALL ROLES
 # ----------------------------
 @router.get("/", response_model=List[Role])
-async def get_roles(
+def get_roles(
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
 ):
@@ -40,7 +40,7 @@ async def get_roles(
 # 📌 READ ONE ROLE
 # ----------------------------
 @router.get("/{role_id}", response_model=Role)
-async def get_role(
+def get_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -55,7 +55,7 @@ async def get_role(
 # 📌 UPDATE ROLE
 # ----------------------------
 @router.put("/{role_id}", response_model=Role)
-async def update_role(
+def update_role(
     role_id: int,
     role: RoleCreate,
     db: Session = Depends(get_db),
@@ -77,7 +77,7 @@ async def update_role(
 # 📌 DELETE ROLE
 # ----------------------------
 @router.delete("/{role_id}")
-async def delete_role(
+def delete_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(require_authentication)
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from sqlmodel import Session, select
 from typing import List, Optional
-from datetime import datetime, timezone
 from fastapi.responses import FileResponse
 import os
 from uuid import uuid4
@@ -90,8 +89,7 @@ def create_attachment(
         TicketMessageId=TicketMessageId,
         FileName=final_file_name,
         FileType=final_file_type,
-        FilePath=rel_path,
-        CreatedAt=datetime.now(timezone.utc)
+        FilePath=rel_path
     )
     db.add(db_att)
     db.commit()
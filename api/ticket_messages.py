@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 from typing import List
-from datetime import datetime, timezone
 
 from bd.dependencies import get_db
+from bd.functions import utcnow
 from api.dependencies import get_current_employee, require_authentication, get_current_employee_with_permissions
 from models.ticket_messages import TicketMessages
 from models.employees import Employees
@@ -59,8 +59,7 @@ def create_message(ticket_id: int, payload: TicketMessageCreate, current_employe
     db_msg = TicketMessages(
         TicketId=ticket_id,
         UserId=current_employee.EmployeeId,
-        MessageTxt=payload.MessageTxt,
-        CreatedAt=datetime.now(timezone.utc)
+        MessageTxt=payload.MessageTxt
     )
     db.add(db_msg)
     db.commit()
@@ -87,8 +86,8 @@ def update_message(message_id: int, payload: TicketMessageUpdate, user_permissio
     update_data = payload.model_dump(exclude_unset=True)
     for k, v in update_data.items():
         setattr(db_msg, k, v)
-    db_msg.UpdatedAt = datetime.now(timezone.utc)
-    db_msg.EditedAt = datetime.now(timezone.utc)
+    # Stamped by the database in the UPDATE itself (UpdatedAt via onupdate)
+    db_msg.EditedAt = utcnow()
     db.add(db_msg)
     db.commit()
     db.refresh(db_msg)
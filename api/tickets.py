@@ -1,17 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlmodel import Session, select, or_, and_
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
-from datetime import datetime, timezone
+from sqlalchemy.orm import joinedload, load_only, raiseload
+from typing import List
 
 from api.dependencies import get_current_employee, require_authentication, get_current_employee_with_permissions
 from bd.dependencies import get_db
-from models.tickets import Tickets, TicketStatus, TicketPriority, TicketSLA
+from models.tickets import Tickets
 from models.employees import Employees
 from schemas.tickets import TicketCreate, TicketUpdate, Ticket, TicketFilters, TicketEmployee
 
 router = APIRouter()
 
+# Built once; list responses are dumped in a single call instead of being re-validated
+_ticket_list_adapter = TypeAdapter(List[Ticket])
+
+# TicketFilters fields matched by equality against their column
+_TICKET_FILTER_COLUMNS = {
+    "status": Tickets.Status,
+    "priority": Tickets.Priority,
+    "sla": Tickets.SLA,
+    "assigned_to": Tickets.AssignedTo,
+    "created_by": Tickets.CreatedBy,
+}
+
+# creator/assignee joined in the ticket query with only the TicketEmployee columns
+_TICKET_EMPLOYEE_COLUMNS = (Employees.EmployeeId, Employees.DisplayName, Employees.Email, Employees.Title)
+_TICKET_EMPLOYEES = (
+    joinedload(Tickets.creator).load_only(*_TICKET_EMPLOYEE_COLUMNS, raiseload=True).raiseload("*"),
+    joinedload(Tickets.assignee).load_only(*_TICKET_EMPLOYEE_COLUMNS, raiseload=True).raiseload("*"),
+)
+
 def has_admin_actions(user_permissions: dict) -> bool:
     """Check if user has AdminActions permission for tickets module."""
     for perm in user_permissions.get("permissions", []):
@@ -52,12 +71,7 @@ def ticket_to_schema(db_ticket: Tickets) -> Ticket:
 @router.get("/", response_model=List[Ticket])
 def get_tickets(
     # Filters
-    status: Optional[TicketStatus] = Query(None, description="Filter by ticket status"),
-    priority: Optional[TicketPriority] = Query(None, description="Filter by ticket priority"),
-    sla: Optional[TicketSLA] = Query(None, description="Filter by service level agreement"),
-    assigned_to: Optional[int] = Query(None, description="Filter by assigned employee ID"),
-    created_by: Optional[int] = Query(None, description="Filter by creator employee ID"),
-    search: Optional[str] = Query(None, description="Search in title and description"),
+    filters: TicketFilters = Depends(),
 
     # Pagination
     skip: int = Query(0, ge=0, description="Number of records to skip"),
@@ -67,41 +81,37 @@ def get_tickets(
     _auth=Depends(require_authentication)
 ):
     """Get tickets with optional filters and pagination."""
-    # Build base query with relationships
-    query = select(Tickets).options(
-        selectinload(Tickets.creator),
-        selectinload(Tickets.assignee)
-    )
+    # Build base query with relationships (anything else the serializer touches raises)
+    query = select(Tickets).options(*_TICKET_EMPLOYEES, raiseload("*"))
 
     # Apply filters
-    filters = []
-    if status:
-        filters.append(Tickets.Status == status)
-    if priority:
-        filters.append(Tickets.Priority == priority)
-    if sla:
-        filters.append(Tickets.SLA == sla)
-    if assigned_to:
-        filters.append(Tickets.AssignedTo == assigned_to)
-    if created_by:
-        filters.append(Tickets.CreatedBy == created_by)
-    if search:
-        search_filter = f"%{search}%"
-        filters.append(
+    conditions = [
+        column == getattr(filters, name)
+        for name, column in _TICKET_FILTER_COLUMNS.items()
+        if getattr(filters, name)
+    ]
+    if filters.search:
+        search_filter = f"%{filters.search}%"
+        conditions.append(
             or_(
                 Tickets.Title.ilike(search_filter),
                 Tickets.Description.ilike(search_filter)
             )
         )
 
-    if filters:
-        query = query.where(and_(*filters))
+    if conditions:
+        query = query.where(and_(*conditions))
 
     # Apply ordering (newest first) and pagination
     query = query.order_by(Tickets.CreatedAt.desc()).offset(skip).limit(limit)
 
     tickets = db.exec(query).all()
-    return [ticket_to_schema(ticket) for ticket in tickets]
+    # Serialized straight to JSON bytes by pydantic-core (no intermediate dicts);
+    # GET /employees/ returns its list the same way
+    return Response(
+        content=_ticket_list_adapter.dump_json([ticket_to_schema(ticket) for ticket in tickets]),
+        media_type="application/json"
+    )
 
 # ----------------------------
 # 📌 GET /tickets/{id} (GET SINGLE TICKET)
@@ -115,10 +125,7 @@ def get_ticket(
     """Get a single ticket by ID."""
     db_ticket = db.exec(
         select(Tickets)
-        .options(
-            selectinload(Tickets.creator),
-            selectinload(Tickets.assignee)
-        )
+        .options(*_TICKET_EMPLOYEES, raiseload("*"))
         .filter(Tickets.TicketId == ticket_id)
     ).first()
 
@@ -153,9 +160,7 @@ def create_ticket(
         Priority=ticket.Priority,
         SLA=ticket.SLA,
         CreatedBy=current_employee.EmployeeId,
-        AssignedTo=ticket.AssignedTo,
-        CreatedAt=datetime.now(timezone.utc),
-        UpdatedAt=datetime.now(timezone.utc)
+        AssignedTo=ticket.AssignedTo
     )
 
     db.add(db_ticket)
@@ -165,10 +170,7 @@ def create_ticket(
     # Load relationships for response
     db_ticket = db.exec(
         select(Tickets)
-        .options(
-            selectinload(Tickets.creator),
-            selectinload(Tickets.assignee)
-        )
+        .options(*_TICKET_EMPLOYEES)
         .filter(Tickets.TicketId == db_ticket.TicketId)
     ).first()
 
@@ -178,7 +180,7 @@ def create_ticket(
 # 📌 PATCH /tickets/{id} (UPDATE TICKET)
 # ----------------------------
 @router.patch("/{ticket_id}", response_model=Ticket)
-async def update_ticket(
+def update_ticket(
     ticket_id: int,
     ticket_update: TicketUpdate,
     user_permissions: dict = Depends(get_current_employee_with_permissions),
@@ -190,10 +192,7 @@ async def update_ticket(
     # Get ticket
     db_ticket = db.exec(
         select(Tickets)
-        .options(
-            selectinload(Tickets.creator),
-            selectinload(Tickets.assignee)
-        )
+        .options(*_TICKET_EMPLOYEES)
         .filter(Tickets.TicketId == ticket_id)
     ).first()
 
@@ -225,9 +224,6 @@ async def update_ticket(
     for key, value in update_data.items():
         setattr(db_ticket, key, value)
 
-    # Update timestamp
-    db_ticket.UpdatedAt = datetime.now(timezone.utc)
-
     db.commit()
     db.refresh(db_ticket)
 
@@ -237,7 +233,7 @@ async def update_ticket(
 # 📌 DELETE /tickets/{id} (SOFT DELETE - MARK AS CLOSED)
 # ----------------------------
 @router.delete("/{ticket_id}")
-async def delete_ticket(
+def delete_ticket(
     ticket_id: int,
     user_permissions: dict = Depends(get_current_employee_with_permissions),
     db: Session = Depends(get_db)
@@ -245,13 +241,10 @@ async def delete_ticket(
     """Soft delete a ticket by marking it as closed. Only creator or users with AdminActions can delete."""
     current_employee_id = user_permissions["employee"]["EmployeeId"]
     
-    # Get ticket
+    # Get ticket (only the columns needed for the permission check and delete)
     db_ticket = db.exec(
         select(Tickets)
-        .options(
-            selectinload(Tickets.creator),
-            selectinload(Tickets.assignee)
-        )
+        .options(load_only(Tickets.TicketId, Tickets.CreatedBy, Tickets.AssignedTo), raiseload("*"))
         .filter(Tickets.TicketId == ticket_id)
     ).first()
 
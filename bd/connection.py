@@ -31,7 +31,18 @@ else:
    database_url = f"mssql+pyodbc://@{server}/{database}?driver={driver}&trusted_connection=yes"
 
 
-engine = create_engine(database_url, echo=echo)
+# Larger compiled-statement cache (default 500) so every endpoint's queries stay cached
+# Pool sized for FastAPI's threadpool; stale connections are checked/recycled before reuse
+engine = create_engine(
+    database_url,
+    echo=echo,
+    query_cache_size=1200,
+    pool_size=25,
+    max_overflow=25,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    fast_executemany=True,  # pyodbc sends executemany batches in one round-trip
+)
 
 # Create the session
 SessionLocal = sessionmaker(bind=engine, class_=Session)
@@ -44,6 +55,7 @@ from models.licenses import Licenses
 from models.countries import Countries
 from models.curriculums import Curriculums
 from models.modules import Modules, RoleModules
+from models.tickets import Tickets
 from models.ticket_messages import TicketMessages, TicketAttachments
 
 # Function to create tables
@@ -0,0 +1,20 @@
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import DateTime
+
+
+class utcnow(FunctionElement):
+    """Current UTC timestamp evaluated by the database (for server defaults)"""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "mssql")
+def _mssql_utcnow(element, compiler, **kw):
+    return "SYSUTCDATETIME()"
@@ -0,0 +1,41 @@
+USE [PrimeFireCorp]
+GO
+
+/****** Script to add lookup indexes used by the Microsoft 365 employee sync ******/
+/****** Execute this script to add the indexes without affecting existing data ******/
+
+-- Email lookups (NULL emails skipped). Not unique: login and the Graph sync can both
+-- write the same address (UPN vs mail alias), and neither treats that as a conflict
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Employees_Email')
+BEGIN
+    PRINT 'Adding index IX_Employees_Email...'
+    CREATE NONCLUSTERED INDEX [IX_Employees_Email] ON [dbo].[Employees] ([Email] ASC)
+    WHERE [Email] IS NOT NULL
+    PRINT 'Index added!'
+END
+GO
+
+-- Replaced by IX_Employees_Email (databases where an earlier version of this script ran)
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'UX_Employees_Email')
+BEGIN
+    PRINT 'Dropping index UX_Employees_Email...'
+    DROP INDEX [UX_Employees_Email] ON [dbo].[Employees]
+    PRINT 'Index dropped!'
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Employees_AzureUpn')
+BEGIN
+    PRINT 'Adding index IX_Employees_AzureUpn...'
+    CREATE NONCLUSTERED INDEX [IX_Employees_AzureUpn] ON [dbo].[Employees] ([AzureUpn] ASC)
+    PRINT 'Index added!'
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Employees_LastSyncedAt')
+BEGIN
+    PRINT 'Adding index IX_Employees_LastSyncedAt...'
+    CREATE NONCLUSTERED INDEX [IX_Employees_LastSyncedAt] ON [dbo].[Employees] ([LastSyncedAt] ASC)
+    PRINT 'Index added!'
+END
+GO
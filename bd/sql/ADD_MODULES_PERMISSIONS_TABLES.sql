@@ -13,14 +13,14 @@ BEGIN
     CREATE TABLE [dbo].[Modules](
         [ModuleId] [int] IDENTITY(1,1) NOT NULL,
         [ModuleName] [nvarchar](50) NOT NULL,
-        [ModuleKey] [varchar](50) NOT NULL,
+        [ModuleKey] [varchar](40) NOT NULL,
         [Description] [nvarchar](200) NULL,
         [Icon] [varchar](50) NULL,
         [RouteUrl] [varchar](100) NULL,
         [DisplayOrder] [int] NULL DEFAULT 0,
         [IsActive] [bit] NOT NULL DEFAULT 1,
         [ParentModuleId] [int] NULL,
-        [CreatedAt] [datetime] NOT NULL DEFAULT GETDATE(),
+        [CreatedAt] [datetime2](7) NOT NULL DEFAULT SYSUTCDATETIME(),
      CONSTRAINT [PK_Modules] PRIMARY KEY CLUSTERED
     (
         [ModuleId] ASC
@@ -52,7 +52,7 @@ BEGIN
         [CanEdit] [bit] NOT NULL DEFAULT 0,
         [CanDelete] [bit] NOT NULL DEFAULT 0,
         [CanExport] [bit] NOT NULL DEFAULT 0,
-        [AssignedAt] [datetime] NOT NULL DEFAULT GETDATE(),
+        [AssignedAt] [datetime2](7) NOT NULL DEFAULT SYSUTCDATETIME(),
      CONSTRAINT [PK_RoleModules] PRIMARY KEY CLUSTERED
     (
         [RoleId] ASC,
@@ -102,6 +102,15 @@ BEGIN
 END
 GO
 
+-- Index for permission lookups by module (PK leads with RoleId)
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_RoleModules_ModuleId')
+BEGIN
+    PRINT 'Adding index IX_RoleModules_ModuleId...'
+    CREATE NONCLUSTERED INDEX [IX_RoleModules_ModuleId] ON [dbo].[RoleModules] ([ModuleId] ASC)
+    PRINT 'Index added!'
+END
+GO
+
 -- Insert seed data for Modules
 IF NOT EXISTS (SELECT * FROM [dbo].[Modules])
 BEGIN
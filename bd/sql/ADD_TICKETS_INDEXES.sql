@@ -0,0 +1,48 @@
+USE [PrimeFireCorp]
+GO
+
+/****** Script to move existing Tickets tables to the ticket list indexes of tickets.sql ******/
+/****** Adds the creator / assignee composite indexes and drops the indexes they replace ******/
+/****** Safe to run more than once ******/
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Tickets_CreatedBy_CreatedAt' AND object_id = OBJECT_ID('dbo.Tickets'))
+BEGIN
+    PRINT 'Adding index IX_Tickets_CreatedBy_CreatedAt...'
+    CREATE NONCLUSTERED INDEX [IX_Tickets_CreatedBy_CreatedAt] ON [dbo].[Tickets] ([CreatedBy] ASC, [CreatedAt] DESC)
+    PRINT 'Index added!'
+END
+GO
+
+-- Also serves AssignedTo-only lookups (left prefix)
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Tickets_AssignedTo_Status_CreatedAt' AND object_id = OBJECT_ID('dbo.Tickets'))
+BEGIN
+    PRINT 'Adding index IX_Tickets_AssignedTo_Status_CreatedAt...'
+    CREATE NONCLUSTERED INDEX [IX_Tickets_AssignedTo_Status_CreatedAt] ON [dbo].[Tickets] ([AssignedTo] ASC, [Status] ASC, [CreatedAt] DESC)
+    PRINT 'Index added!'
+END
+GO
+
+-- Left prefixes of the indexes above: they only add write cost
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Tickets_CreatedBy' AND object_id = OBJECT_ID('dbo.Tickets'))
+BEGIN
+    PRINT 'Dropping index IX_Tickets_CreatedBy...'
+    DROP INDEX [IX_Tickets_CreatedBy] ON [dbo].[Tickets]
+    PRINT 'Index dropped!'
+END
+GO
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Tickets_AssignedTo' AND object_id = OBJECT_ID('dbo.Tickets'))
+BEGIN
+    PRINT 'Dropping index IX_Tickets_AssignedTo...'
+    DROP INDEX [IX_Tickets_AssignedTo] ON [dbo].[Tickets]
+    PRINT 'Index dropped!'
+END
+GO
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Tickets_AssignedTo_CreatedAt' AND object_id = OBJECT_ID('dbo.Tickets'))
+BEGIN
+    PRINT 'Dropping index IX_Tickets_AssignedTo_CreatedAt...'
+    DROP INDEX [IX_Tickets_AssignedTo_CreatedAt] ON [dbo].[Tickets]
+    PRINT 'Index dropped!'
+END
+GO
@@ -0,0 +1,38 @@
+USE [PrimeFireCorp]
+GO
+
+/****** Script to move existing Tickets to the lowercase Status / Priority values ******/
+/****** Older rows may hold the uppercase enum names ('TODO', 'IN_PROGRESS'), which the ******/
+/****** case-insensitive collation let through the CHECK constraints. Safe to run more than once. ******/
+
+IF EXISTS (
+    SELECT 1 FROM [dbo].[Tickets]
+    WHERE [Status] COLLATE Latin1_General_CS_AS <> LOWER([Status])
+       OR [Priority] COLLATE Latin1_General_CS_AS <> LOWER([Priority])
+)
+BEGIN
+    PRINT 'Lowercasing Tickets.Status / Tickets.Priority...'
+    UPDATE [dbo].[Tickets] SET [Status] = LOWER([Status]), [Priority] = LOWER([Priority])
+    WHERE [Status] COLLATE Latin1_General_CS_AS <> LOWER([Status])
+       OR [Priority] COLLATE Latin1_General_CS_AS <> LOWER([Priority])
+    PRINT 'Rows updated!'
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.check_constraints WHERE name = 'CK_Tickets_Status')
+BEGIN
+    PRINT 'Adding constraint CK_Tickets_Status...'
+    ALTER TABLE [dbo].[Tickets] ADD CONSTRAINT [CK_Tickets_Status]
+        CHECK ([Status] IN ('todo', 'active', 'inactive', 'closed', 'done', 'in_progress', 'on_hold'))
+    PRINT 'Constraint added!'
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.check_constraints WHERE name = 'CK_Tickets_Priority')
+BEGIN
+    PRINT 'Adding constraint CK_Tickets_Priority...'
+    ALTER TABLE [dbo].[Tickets] ADD CONSTRAINT [CK_Tickets_Priority]
+        CHECK ([Priority] IN ('low', 'normal', 'medium', 'high', 'urgent'))
+    PRINT 'Constraint added!'
+END
+GO
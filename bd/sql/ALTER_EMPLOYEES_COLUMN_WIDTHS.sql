@@ -0,0 +1,46 @@
+USE [PrimeFireCorp]
+GO
+
+/****** Script to resize Employees phone / postal code columns to the model widths ******/
+/****** Phone, MobilePhone, OfficePhone: nvarchar(20) -> nvarchar(24); PostalCode: nvarchar(20) -> nvarchar(16) ******/
+/****** Safe to run more than once: columns already at the target width are skipped ******/
+
+-- COL_LENGTH returns bytes (2 per nvarchar character)
+IF COL_LENGTH('dbo.Employees', 'Phone') < 48
+BEGIN
+    PRINT 'Widening Employees.Phone to nvarchar(24)...'
+    ALTER TABLE [dbo].[Employees] ALTER COLUMN [Phone] [nvarchar](24) NULL
+    PRINT 'Column updated!'
+END
+GO
+
+IF COL_LENGTH('dbo.Employees', 'MobilePhone') < 48
+BEGIN
+    PRINT 'Widening Employees.MobilePhone to nvarchar(24)...'
+    ALTER TABLE [dbo].[Employees] ALTER COLUMN [MobilePhone] [nvarchar](24) NULL
+    PRINT 'Column updated!'
+END
+GO
+
+IF COL_LENGTH('dbo.Employees', 'OfficePhone') < 48
+BEGIN
+    PRINT 'Widening Employees.OfficePhone to nvarchar(24)...'
+    ALTER TABLE [dbo].[Employees] ALTER COLUMN [OfficePhone] [nvarchar](24) NULL
+    PRINT 'Column updated!'
+END
+GO
+
+-- Shrinking: refuse to truncate existing postal codes
+IF COL_LENGTH('dbo.Employees', 'PostalCode') > 32
+BEGIN
+    IF EXISTS (SELECT 1 FROM [dbo].[Employees] WHERE LEN([PostalCode]) > 16)
+    BEGIN
+        RAISERROR('Employees.PostalCode has values longer than 16 characters; fix them before running this script.', 16, 1)
+        RETURN
+    END
+
+    PRINT 'Resizing Employees.PostalCode to nvarchar(16)...'
+    ALTER TABLE [dbo].[Employees] ALTER COLUMN [PostalCode] [nvarchar](16) NULL
+    PRINT 'Column updated!'
+END
+GO
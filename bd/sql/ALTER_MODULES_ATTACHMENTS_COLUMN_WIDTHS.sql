@@ -0,0 +1,50 @@
+USE [PrimeFireCorp]
+GO
+
+/****** Script to shrink Modules.ModuleKey and ticketAttachments.FilePath to the model widths ******/
+/****** ModuleKey: varchar(50) -> varchar(40); FilePath: nvarchar(500) -> nvarchar(260) ******/
+/****** Safe to run more than once: columns already at the target width are skipped. ******/
+/****** Each shrink is refused (nothing changed) while existing values are longer than the new width. ******/
+
+SET XACT_ABORT ON
+GO
+
+-- COL_LENGTH returns bytes (1 per varchar character)
+IF COL_LENGTH('dbo.Modules', 'ModuleKey') > 40
+BEGIN
+    IF EXISTS (SELECT 1 FROM [dbo].[Modules] WHERE LEN([ModuleKey]) > 40)
+    BEGIN
+        SELECT [ModuleId], [ModuleKey] FROM [dbo].[Modules] WHERE LEN([ModuleKey]) > 40
+        RAISERROR('Modules.ModuleKey has values longer than 40 characters (listed above); shorten them before running this script.', 16, 1)
+        RETURN
+    END
+
+    PRINT 'Resizing Modules.ModuleKey to varchar(40)...'
+    BEGIN TRANSACTION
+        -- A column cannot be shrunk while a unique constraint is built on it
+        IF EXISTS (SELECT * FROM sys.key_constraints WHERE name = 'UQ_Modules_ModuleKey' AND parent_object_id = OBJECT_ID('dbo.Modules'))
+            ALTER TABLE [dbo].[Modules] DROP CONSTRAINT [UQ_Modules_ModuleKey]
+
+        ALTER TABLE [dbo].[Modules] ALTER COLUMN [ModuleKey] [varchar](40) NOT NULL
+
+        ALTER TABLE [dbo].[Modules] ADD CONSTRAINT [UQ_Modules_ModuleKey] UNIQUE NONCLUSTERED ([ModuleKey] ASC)
+    COMMIT TRANSACTION
+    PRINT 'Column updated!'
+END
+GO
+
+-- COL_LENGTH returns bytes (2 per nvarchar character)
+IF COL_LENGTH('dbo.ticketAttachments', 'FilePath') > 520
+BEGIN
+    IF EXISTS (SELECT 1 FROM [dbo].[ticketAttachments] WHERE LEN([FilePath]) > 260)
+    BEGIN
+        SELECT [TicketAttachmentId], [FilePath] FROM [dbo].[ticketAttachments] WHERE LEN([FilePath]) > 260
+        RAISERROR('ticketAttachments.FilePath has values longer than 260 characters (listed above); fix them before running this script.', 16, 1)
+        RETURN
+    END
+
+    PRINT 'Resizing ticketAttachments.FilePath to nvarchar(260)...'
+    ALTER TABLE [dbo].[ticketAttachments] ALTER COLUMN [FilePath] [nvarchar](260) NULL
+    PRINT 'Column updated!'
+END
+GO
@@ -0,0 +1,79 @@
+USE [PrimeFireCorp]
+GO
+
+/****** Script to stamp Jobs / Curriculums / Modules / RoleModules timestamps in UTC ******/
+/****** Replaces the DEFAULT GETDATE() constraints with DEFAULT SYSUTCDATETIME() and datetime -> datetime2(7), ******/
+/****** matching Tickets / ticketMessages. Safe to run more than once: columns already defaulting to SYSUTCDATETIME() are skipped. ******/
+/****** Existing rows keep the server-local times they were stamped with. ******/
+
+DECLARE @constraint sysname
+DECLARE @sql nvarchar(max)
+
+-- Jobs.PostedAt
+SET @constraint = NULL
+SELECT @constraint = dc.name
+FROM sys.default_constraints dc
+JOIN sys.columns c ON c.object_id = dc.parent_object_id AND c.column_id = dc.parent_column_id
+WHERE dc.parent_object_id = OBJECT_ID('dbo.Jobs') AND c.name = 'PostedAt' AND dc.definition NOT LIKE '%sysutcdatetime%'
+
+IF @constraint IS NOT NULL
+BEGIN
+    PRINT 'Switching Jobs.PostedAt to SYSUTCDATETIME()...'
+    SET @sql = N'ALTER TABLE [dbo].[Jobs] DROP CONSTRAINT ' + QUOTENAME(@constraint)
+    EXEC sp_executesql @sql
+    ALTER TABLE [dbo].[Jobs] ALTER COLUMN [PostedAt] [datetime2](7) NOT NULL
+    ALTER TABLE [dbo].[Jobs] ADD CONSTRAINT [DF_Jobs_PostedAt] DEFAULT (SYSUTCDATETIME()) FOR [PostedAt]
+    PRINT 'Default updated!'
+END
+
+-- Curriculums.SubmittedAt
+SET @constraint = NULL
+SELECT @constraint = dc.name
+FROM sys.default_constraints dc
+JOIN sys.columns c ON c.object_id = dc.parent_object_id AND c.column_id = dc.parent_column_id
+WHERE dc.parent_object_id = OBJECT_ID('dbo.Curriculums') AND c.name = 'SubmittedAt' AND dc.definition NOT LIKE '%sysutcdatetime%'
+
+IF @constraint IS NOT NULL
+BEGIN
+    PRINT 'Switching Curriculums.SubmittedAt to SYSUTCDATETIME()...'
+    SET @sql = N'ALTER TABLE [dbo].[Curriculums] DROP CONSTRAINT ' + QUOTENAME(@constraint)
+    EXEC sp_executesql @sql
+    ALTER TABLE [dbo].[Curriculums] ALTER COLUMN [SubmittedAt] [datetime2](7) NOT NULL
+    ALTER TABLE [dbo].[Curriculums] ADD CONSTRAINT [DF_Curriculums_SubmittedAt] DEFAULT (SYSUTCDATETIME()) FOR [SubmittedAt]
+    PRINT 'Default updated!'
+END
+
+-- Modules.CreatedAt
+SET @constraint = NULL
+SELECT @constraint = dc.name
+FROM sys.default_constraints dc
+JOIN sys.columns c ON c.object_id = dc.parent_object_id AND c.column_id = dc.parent_column_id
+WHERE dc.parent_object_id = OBJECT_ID('dbo.Modules') AND c.name = 'CreatedAt' AND dc.definition NOT LIKE '%sysutcdatetime%'
+
+IF @constraint IS NOT NULL
+BEGIN
+    PRINT 'Switching Modules.CreatedAt to SYSUTCDATETIME()...'
+    SET @sql = N'ALTER TABLE [dbo].[Modules] DROP CONSTRAINT ' + QUOTENAME(@constraint)
+    EXEC sp_executesql @sql
+    ALTER TABLE [dbo].[Modules] ALTER COLUMN [CreatedAt] [datetime2](7) NOT NULL
+    ALTER TABLE [dbo].[Modules] ADD CONSTRAINT [DF_Modules_CreatedAt] DEFAULT (SYSUTCDATETIME()) FOR [CreatedAt]
+    PRINT 'Default updated!'
+END
+
+-- RoleModules.AssignedAt
+SET @constraint = NULL
+SELECT @constraint = dc.name
+FROM sys.default_constraints dc
+JOIN sys.columns c ON c.object_id = dc.parent_object_id AND c.column_id = dc.parent_column_id
+WHERE dc.parent_object_id = OBJECT_ID('dbo.RoleModules') AND c.name = 'AssignedAt' AND dc.definition NOT LIKE '%sysutcdatetime%'
+
+IF @constraint IS NOT NULL
+BEGIN
+    PRINT 'Switching RoleModules.AssignedAt to SYSUTCDATETIME()...'
+    SET @sql = N'ALTER TABLE [dbo].[RoleModules] DROP CONSTRAINT ' + QUOTENAME(@constraint)
+    EXEC sp_executesql @sql
+    ALTER TABLE [dbo].[RoleModules] ALTER COLUMN [AssignedAt] [datetime2](7) NOT NULL
+    ALTER TABLE [dbo].[RoleModules] ADD CONSTRAINT [DF_RoleModules_AssignedAt] DEFAULT (SYSUTCDATETIME()) FOR [AssignedAt]
+    PRINT 'Default updated!'
+END
+GO
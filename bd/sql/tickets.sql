@@ -66,15 +66,19 @@ CREATE NONCLUSTERED INDEX [IX_Tickets_Priority] ON [dbo].[Tickets]
 )WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
 GO
 
-CREATE NONCLUSTERED INDEX [IX_Tickets_CreatedBy] ON [dbo].[Tickets]
+CREATE NONCLUSTERED INDEX [IX_Tickets_CreatedBy_CreatedAt] ON [dbo].[Tickets]
 (
-	[CreatedBy] ASC
+	[CreatedBy] ASC,
+	[CreatedAt] DESC
 )WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
 GO
 
-CREATE NONCLUSTERED INDEX [IX_Tickets_AssignedTo] ON [dbo].[Tickets]
+-- Also serves AssignedTo-only lookups (left prefix)
+CREATE NONCLUSTERED INDEX [IX_Tickets_AssignedTo_Status_CreatedAt] ON [dbo].[Tickets]
 (
-	[AssignedTo] ASC
+	[AssignedTo] ASC,
+	[Status] ASC,
+	[CreatedAt] DESC
 )WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
 GO
 
@@ -116,9 +120,22 @@ BEGIN
         TicketMessageId INT NULL,
         FileName NVARCHAR(255) NOT NULL,
         FileType NVARCHAR(100) NULL,
-        FilePath NVARCHAR(500) NULL,
+        FilePath NVARCHAR(260) NULL,
         CreatedAt DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
         CONSTRAINT FK_ticketAttachments_Tickets FOREIGN KEY (TicketId) REFERENCES Tickets(TicketId),
         CONSTRAINT FK_ticketAttachments_TicketMessages FOREIGN KEY (TicketMessageId) REFERENCES ticketMessages(TicketMessageId)
     );
 END
+
+-- Indexes for ticket messages / attachments lookups
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_ticketMessages_TicketId_CreatedAt')
+    CREATE NONCLUSTERED INDEX [IX_ticketMessages_TicketId_CreatedAt] ON [dbo].[ticketMessages] ([TicketId] ASC, [CreatedAt] ASC);
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_ticketMessages_UserId')
+    CREATE NONCLUSTERED INDEX [IX_ticketMessages_UserId] ON [dbo].[ticketMessages] ([UserId] ASC);
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_ticketAttachments_TicketId_CreatedAt')
+    CREATE NONCLUSTERED INDEX [IX_ticketAttachments_TicketId_CreatedAt] ON [dbo].[ticketAttachments] ([TicketId] ASC, [CreatedAt] ASC);
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_ticketAttachments_TicketMessageId')
+    CREATE NONCLUSTERED INDEX [IX_ticketAttachments_TicketMessageId] ON [dbo].[ticketAttachments] ([TicketMessageId] ASC);
@@ -0,0 +1,121 @@
+"""Azure AD authentication helpers."""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import httpx
+import jwt
+from fastapi_azure_auth import SingleTenantAzureAuthorizationCodeBearer
+from fastapi_azure_auth.openid_config import OpenIdConfig
+
+log = logging.getLogger(__name__)
+
+# Max validated tokens kept in memory (entries also expire with the token)
+TOKEN_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=16)
+def _parse_signing_key(jwk_json: str):
+    """Parse a JWK into a public key (cached, JWKS rarely changes between refreshes)"""
+    return jwt.PyJWK(json.loads(jwk_json), "RS256").key
+
+
+class PooledOpenIdConfig(OpenIdConfig):
+    """
+    OpenID configuration loader that reuses a pooled HTTP client for the
+    discovery document and JWKS, and caches the kid -> public key parse
+
+    fastapi-azure-auth opens its own AsyncClient inside the private
+    _load_openid_config/_load_keys, so both are overridden here. They mirror
+    the pinned 5.2.0 release; tests/test_azure_auth.py checks the pin and
+    drives the public load_config() through these overrides.
+    """
+
+    def __init__(self, *args, http_client: Optional[httpx.AsyncClient] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._client: Optional[httpx.AsyncClient] = http_client
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client (created lazily, reused across refreshes)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=10)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _load_openid_config(self) -> None:
+        """Load openid config and signing keys using the pooled client"""
+        path = "common" if self.multi_tenant else self.tenant_id
+        config_url = self.config_url or f"https://login.microsoftonline.com/{path}/v2.0/.well-known/openid-configuration"
+        if self.app_id:
+            config_url += f"?appid={self.app_id}"
+
+        client = self._get_client()
+        openid_response = await client.get(config_url)
+        openid_response.raise_for_status()
+        openid_cfg = openid_response.json()
+
+        self.authorization_endpoint = openid_cfg["authorization_endpoint"]
+        self.token_endpoint = openid_cfg["token_endpoint"]
+        self.issuer = openid_cfg["issuer"]
+
+        jwks_response = await client.get(openid_cfg["jwks_uri"])
+        jwks_response.raise_for_status()
+        self._load_keys(jwks_response.json()["keys"])
+
+    def _load_keys(self, keys: List[Dict[str, Any]]) -> None:
+        """Store signing keys by kid, skipping encryption keys and keys without a kid"""
+        self.signing_keys = {}
+        for key in keys:
+            kid = key.get("kid")
+            if key.get("use") == "sig" and kid:
+                self.signing_keys[kid] = _parse_signing_key(json.dumps(key, sort_keys=True))
+
+
+class CachedAzureAuthorizationCodeBearer(SingleTenantAzureAuthorizationCodeBearer):
+    """
+    Single tenant bearer that reuses the claims of already validated tokens
+    Repeat requests with the same token skip the RSA signature check until it expires
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Same settings as the config the library built (tenant, app id, config URL, multi-tenant)
+        self.openid_config = PooledOpenIdConfig(
+            tenant_id=self.openid_config.tenant_id,
+            multi_tenant=self.openid_config.multi_tenant,
+            app_id=self.openid_config.app_id,
+            config_url=self.openid_config.config_url,
+        )
+        self._claims_cache: "OrderedDict[tuple[str, str, str], tuple[float, Any, Dict[str, Any]]]" = OrderedDict()
+
+    def validate(self, access_token: str, key, iss: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the token, or return the cached claims if it was already validated the same way"""
+        # Keyed on everything the check depends on; the signing key is compared by identity,
+        # so a rotated key (even under the same kid) misses the cache
+        cache_key = (
+            hashlib.sha256(access_token.encode()).hexdigest(),
+            iss,
+            json.dumps(options, sort_keys=True),
+        )
+        cached = self._claims_cache.get(cache_key)
+        if cached and cached[1] is key and time.time() < cached[0]:
+            self._claims_cache.move_to_end(cache_key)
+            return dict(cached[2])
+
+        claims = super().validate(access_token=access_token, key=key, iss=iss, options=options)
+
+        self._claims_cache[cache_key] = (claims["exp"], key, claims)
+        self._claims_cache.move_to_end(cache_key)
+        if len(self._claims_cache) > TOKEN_CACHE_SIZE:
+            self._claims_cache.popitem(last=False)
+        return dict(claims)
@@ -3,14 +3,19 @@ from datetime import datetime, timedelta
 from typing import Optional
 import logging
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 from core.microsoft_graph import graph_client
+from core.cache import clear_reference_caches, get_country_id
 from models.employees import Employees
 from models.countries import Countries
 from bd.connection import engine
 
 logger = logging.getLogger(__name__)
 
+# Number of Graph users upserted per DB round-trip / commit
+SYNC_BATCH_SIZE = 500
+
 def normalize_country_to_code(country_name: str) -> Optional[str]:
     """
     Convert country names or codes to standard ISO 3166-1 alpha-2 codes.
@@ -72,18 +77,15 @@ async def get_or_create_country_id(db: Session, country_input: str) -> tuple[Opt
         return None, False
 
     # Try to find existing country by code
-    existing_country = db.exec(
-        select(Countries).filter(Countries.Name == country_code)
-    ).first()
-
-    if existing_country:
-        return existing_country.CountryId, False
+    existing_country_id = get_country_id(db, country_code)
+    if existing_country_id is not None:
+        return existing_country_id, False
 
     # Create new country with ISO code
+    # Flush only: the caller's commit (or rollback) covers the new country
     new_country = Countries(Name=country_code)
     db.add(new_country)
-    db.commit()
-    db.refresh(new_country)
+    db.flush()
     return new_country.CountryId, True
 
 def is_primefire_domain(email: str) -> bool:
@@ -151,53 +153,24 @@ class EmployeeSyncScheduler:
             }
             
             with Session(engine) as db:
+                # Filter only PrimeFire domains
+                primefire_users = []
                 for ms_user in ms_users:
-                    try:
-                        # Filter only PrimeFire domains
-                        email = ms_user.get("userPrincipalName") or ms_user.get("mail")
-                        if not email or not is_primefire_domain(email):
-                            # Debug: log skipped users
-                            logger.debug(f"⏭️ Skipping user {email} - not PrimeFire domain")
-                            continue  # Skip non-PrimeFire users
-
-                        stats["primefire_users"] += 1
-                        logger.debug(f"✅ Processing PrimeFire user: {email}")
-
-                        # Get country from Graph user data
-                        graph_country = ms_user.get("country")
-                        country_id, country_created = await get_or_create_country_id(db, graph_country) if graph_country else (None, False)
-
-                        if country_created:
-                            stats["countries_created"] += 1
-
-                        employee_data = graph_client.map_graph_user_to_employee(ms_user)
-                        employee_data["LastSyncedAt"] = datetime.now()
-                        employee_data["CountryId"] = country_id
-
-                        stats["processed"] += 1
-
-                        # Check if employee exists by AzureOid
-                        existing = db.exec(
-                            select(Employees).filter(Employees.AzureOid == employee_data["AzureOid"])
-                        ).first()
-
-                        if existing:
-                            # Update existing employee
-                            for key, value in employee_data.items():
-                                if value is not None:
-                                    setattr(existing, key, value)
-                            stats["updated"] += 1
-                        else:
-                            # Create new employee
-                            new_employee = Employees(**employee_data)
-                            db.add(new_employee)
-                            stats["created"] += 1
-
-                        db.commit()
-
-                    except Exception as e:
-                        stats["errors"] += 1
-                        continue
+                    email = ms_user.get("userPrincipalName") or ms_user.get("mail")
+                    if not email or not is_primefire_domain(email):
+                        # Debug: log skipped users
+                        logger.debug(f"⏭️ Skipping user {email} - not PrimeFire domain")
+                        continue  # Skip non-PrimeFire users
+                    primefire_users.append(ms_user)
+
+                stats["primefire_users"] = len(primefire_users)
+
+                # Country lookups are shared across the whole sync
+                country_ids: dict[str, Optional[int]] = {}
+
+                for start in range(0, len(primefire_users), SYNC_BATCH_SIZE):
+                    batch = primefire_users[start:start + SYNC_BATCH_SIZE]
+                    await self._sync_batch(db, batch, country_ids, stats)
             
             self.last_sync = datetime.now()
             
@@ -207,6 +180,129 @@ class EmployeeSyncScheduler:
             logger.error(f"❌ Failed to sync from Microsoft 365: {e}")
             raise
     
+    async def _stage_user(
+        self,
+        db: Session,
+        ms_user: dict,
+        existing_by_oid: dict[str, Employees],
+        country_ids: dict[str, Optional[int]],
+        new_countries: list[str],
+    ) -> bool:
+        """Stage the insert/update of one Graph user; returns True if the employee is new"""
+        # Get country from Graph user data
+        graph_country = ms_user.get("country")
+        if graph_country not in country_ids:
+            country_id, country_created = await get_or_create_country_id(db, graph_country) if graph_country else (None, False)
+            country_ids[graph_country] = country_id
+            if country_created:
+                new_countries.append(graph_country)
+
+        employee_data = graph_client.map_graph_user_to_employee(ms_user)
+        # Employees stores the country as CountryId; there is no Country column
+        employee_data.pop("Country", None)
+        employee_data["LastSyncedAt"] = datetime.now()
+        employee_data["CountryId"] = country_ids[graph_country]
+
+        existing = existing_by_oid.get(employee_data["AzureOid"])
+        if existing:
+            # Update existing employee
+            for key, value in employee_data.items():
+                if value is not None:
+                    setattr(existing, key, value)
+            return False
+
+        # Create new employee
+        new_employee = Employees(**employee_data)
+        db.add(new_employee)
+        existing_by_oid[employee_data["AzureOid"]] = new_employee
+        return True
+
+    @staticmethod
+    def _discard_new_countries(country_ids: dict[str, Optional[int]], new_countries: list[str]) -> None:
+        """Forget countries whose insert was rolled back so they get created again"""
+        for graph_country in new_countries:
+            country_ids.pop(graph_country, None)
+        if new_countries:
+            clear_reference_caches()
+
+    async def _sync_batch(
+        self,
+        db: Session,
+        batch: list[dict],
+        country_ids: dict[str, Optional[int]],
+        stats: dict,
+    ) -> None:
+        """
+        Upsert a batch of Graph users with a single commit.
+        If the commit fails (e.g. one row breaks a constraint), the batch is rolled back
+        and its users are retried one commit at a time so only the bad rows fail.
+        """
+        new_countries: list[str] = []
+        counts = {"created": 0, "updated": 0, "errors": 0}
+
+        try:
+            # Load every existing employee of the batch in a single query
+            azure_oids = [ms_user.get("id") for ms_user in batch if ms_user.get("id")]
+            existing_by_oid = {
+                employee.AzureOid: employee
+                for employee in db.exec(
+                    select(Employees).where(Employees.AzureOid.in_(azure_oids))
+                ).all()
+            }
+
+            for ms_user in batch:
+                try:
+                    created = await self._stage_user(db, ms_user, existing_by_oid, country_ids, new_countries)
+                except SQLAlchemyError:
+                    raise
+                except Exception as e:
+                    counts["errors"] += 1
+                    logger.error(f"❌ Failed to sync user {ms_user.get('id')}: {e}")
+                    continue
+                counts["created" if created else "updated"] += 1
+
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            self._discard_new_countries(country_ids, new_countries)
+            logger.warning(f"⚠️ Failed to save sync batch ({e}); retrying its {len(batch)} users one by one")
+            await self._sync_users_individually(db, batch, country_ids, stats)
+            return
+
+        stats["created"] += counts["created"]
+        stats["updated"] += counts["updated"]
+        stats["processed"] += counts["created"] + counts["updated"]
+        stats["errors"] += counts["errors"]
+        stats["countries_created"] += len(new_countries)
+
+    async def _sync_users_individually(
+        self,
+        db: Session,
+        batch: list[dict],
+        country_ids: dict[str, Optional[int]],
+        stats: dict,
+    ) -> None:
+        """Upsert each Graph user of a failed batch with its own commit"""
+        for ms_user in batch:
+            new_countries: list[str] = []
+            try:
+                existing = db.exec(
+                    select(Employees).where(Employees.AzureOid == ms_user.get("id"))
+                ).first()
+                existing_by_oid = {existing.AzureOid: existing} if existing else {}
+                created = await self._stage_user(db, ms_user, existing_by_oid, country_ids, new_countries)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                self._discard_new_countries(country_ids, new_countries)
+                stats["errors"] += 1
+                logger.error(f"❌ Failed to sync user {ms_user.get('id')}: {e}")
+                continue
+
+            stats["created" if created else "updated"] += 1
+            stats["processed"] += 1
+            stats["countries_created"] += len(new_countries)
+
     async def _periodic_sync_loop(self):
         """Background loop that runs periodic syncs"""
         while self.is_running:
@@ -0,0 +1,103 @@
+"""Process-local caches for slowly changing reference rows."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from models.countries import Countries
+
+# Reference rows change rarely; entries also expire so other workers' writes show up
+REFERENCE_CACHE_SIZE = 1024
+REFERENCE_CACHE_TTL = 300
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() >= entry[0]:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# CountryId -> Name and Name (ISO code) -> CountryId
+country_names = TTLCache(REFERENCE_CACHE_SIZE, REFERENCE_CACHE_TTL)
+country_ids = TTLCache(REFERENCE_CACHE_SIZE, REFERENCE_CACHE_TTL)
+
+
+def get_country_names(db: Session, ids: Iterable[int]) -> Dict[int, str]:
+    """Resolve country names by id, querying only the ids that are not cached"""
+    names: Dict[int, str] = {}
+    missing = set()
+    for country_id in set(ids):
+        name = country_names.get(country_id, _MISSING)
+        if name is _MISSING:
+            missing.add(country_id)
+        else:
+            names[country_id] = name
+
+    if missing:
+        rows = db.exec(
+            select(Countries.CountryId, Countries.Name).where(Countries.CountryId.in_(missing))
+        ).all()
+        for country_id, name in rows:
+            country_names.set(country_id, name)
+            names[country_id] = name
+
+    return names
+
+
+def get_country_id(db: Session, code: str) -> Optional[int]:
+    """Get the CountryId stored for an ISO country code, or None if it does not exist"""
+    country_id = country_ids.get(code)
+    if country_id is None:
+        country_id = db.exec(select(Countries.CountryId).where(Countries.Name == code)).first()
+        if country_id is not None:
+            country_ids.set(code, country_id)
+    return country_id
+
+
+def clear_reference_caches() -> None:
+    country_names.clear()
+    country_ids.clear()
+
+
+@event.listens_for(Countries, "after_insert")
+@event.listens_for(Countries, "after_update")
+@event.listens_for(Countries, "after_delete")
+def _invalidate_country(mapper, connection, target: Countries) -> None:
+    # The old Name is unknown after an update, so drop every code mapping
+    country_names.pop(target.CountryId)
+    country_ids.clear()
+
+
+@event.listens_for(Countries.__table__, "after_drop")
+def _invalidate_countries_table(target, connection, **kw) -> None:
+    clear_reference_caches()
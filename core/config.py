@@ -2,10 +2,11 @@
 
 from enum import Enum
 
-from fastapi_azure_auth import SingleTenantAzureAuthorizationCodeBearer
 from pydantic import AnyHttpUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from core.azure_auth import CachedAzureAuthorizationCodeBearer
+
 
 class EnvironmentMode(str, Enum):
     """Environment type."""
@@ -110,11 +111,10 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-AZURE_AUTH_SCHEME = SingleTenantAzureAuthorizationCodeBearer(
+AZURE_AUTH_SCHEME = CachedAzureAuthorizationCodeBearer(
     app_client_id=f"api://{settings.BACKEND_CLIENT_ID}",  # Match the audience in the token
     tenant_id=settings.TENANT_ID,
     scopes=settings.scopes,
     leeway=60,  # Add 60 seconds leeway for token validation
     allow_guest_users=True,  # Allow guest users temporarily for debugging
 )
-
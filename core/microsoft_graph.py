@@ -1,8 +1,20 @@
+import asyncio
 import httpx
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from core.config import settings
 
+# Graph throttling / transient failures worth retrying
+RETRYABLE_STATUS_CODES = (429, 503, 504)
+MAX_RETRIES = 5
+
+# Largest page Graph returns for /users (fewer sequential nextLink round-trips)
+USERS_PAGE_SIZE = 999
+
+# Max GET responses kept for conditional (If-None-Match) requests
+ETAG_CACHE_SIZE = 256
+
 class MicrosoftGraphClient:
     """
     Client for Microsoft Graph API to manage users
@@ -16,6 +28,33 @@ class MicrosoftGraphClient:
         self.graph_url = "https://graph.microsoft.com/v1.0"
         self._token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._etag_cache: "OrderedDict[str, tuple[str, Dict[str, Any]]]" = OrderedDict()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client (created lazily, reused across requests)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(retries=3)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    @staticmethod
+    def _get_retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honoring the Retry-After header"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return float(2 ** attempt)
     
     async def _get_access_token(self) -> str:
         """Get access token using client credentials flow"""
@@ -24,23 +63,23 @@ class MicrosoftGraphClient:
         
         token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                token_url,
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "scope": "https://graph.microsoft.com/.default",
-                    "grant_type": "client_credentials"
-                }
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            self._token = data["access_token"]
-            self._token_expiry = datetime.now() + timedelta(seconds=data.get("expires_in", 3600) - 300)
-            
-            return self._token
+        client = self._get_client()
+        response = await client.post(
+            token_url,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": "https://graph.microsoft.com/.default",
+                "grant_type": "client_credentials"
+            }
+        )
+        response.raise_for_status()
+        
+        data = response.json()
+        self._token = data["access_token"]
+        self._token_expiry = datetime.now() + timedelta(seconds=data.get("expires_in", 3600) - 300)
+        
+        return self._token
     
     async def _make_request(
         self, 
@@ -48,16 +87,25 @@ class MicrosoftGraphClient:
         endpoint: str, 
         data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make authenticated request to Graph API"""
-        token = await self._get_access_token()
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        
+        """
+        Make authenticated request to Graph API
+        Throttled (429) and unavailable (503/504) responses are retried with
+        exponential backoff, honoring the Retry-After header sent by Graph
+        GETs send If-None-Match with the last ETag and reuse the cached body on 304
+        """
         url = f"{self.graph_url}{endpoint}"
+        client = self._get_client()
+        cached = self._etag_cache.get(url) if method == "GET" else None
         
-        async with httpx.AsyncClient() as client:
+        for attempt in range(MAX_RETRIES):
+            token = await self._get_access_token()
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            }
+            if cached:
+                headers["If-None-Match"] = cached[0]
+            
             if method == "GET":
                 response = await client.get(url, headers=headers)
             elif method == "PATCH":
@@ -69,18 +117,41 @@ class MicrosoftGraphClient:
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            response.raise_for_status()
+            if response.status_code == 304 and cached:
+                self._etag_cache.move_to_end(url)
+                return cached[1]
+            
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code in RETRYABLE_STATUS_CODES and attempt < MAX_RETRIES - 1:
+                    await asyncio.sleep(self._get_retry_delay(e.response, attempt))
+                    continue
+                raise
             
             if response.status_code == 204:
                 return {}
             
-            return response.json()
+            body = response.json()
+            etag = response.headers.get("ETag")
+            if method == "GET" and etag:
+                self._cache_response(url, etag, body)
+            
+            return body
+    
+    def _cache_response(self, url: str, etag: str, body: Dict[str, Any]):
+        """Store a GET response by URL, evicting the least recently used entry"""
+        self._etag_cache[url] = (etag, body)
+        self._etag_cache.move_to_end(url)
+        if len(self._etag_cache) > ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
     
     async def get_all_users(self) -> List[Dict[str, Any]]:
         """Get all users from Microsoft 365"""
         users = []
-        endpoint = "/users?$select=id,userPrincipalName,displayName,givenName,surname,jobTitle,department,officeLocation,mail,businessPhones,mobilePhone,streetAddress,city,state,postalCode,country,countryLetterCode"
+        endpoint = f"/users?$top={USERS_PAGE_SIZE}&$select=id,userPrincipalName,displayName,givenName,surname,jobTitle,department,officeLocation,mail,businessPhones,mobilePhone,streetAddress,city,state,postalCode,country,countryLetterCode"
         
+        # Graph /users has no $skip; pages can only be walked through @odata.nextLink
         while endpoint:
             data = await self._make_request("GET", endpoint)
             users.extend(data.get("value", []))
@@ -1,10 +1,13 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from sqlalchemy.orm import configure_mappers
+import asyncio
 
 # Import configuration
 from api.dependencies import require_authentication
-from core.config import AZURE_AUTH_SCHEME, settings
+from core.config import AZURE_AUTH_SCHEME, EnvironmentMode, settings
 from models.employees import Employees
 
 # Import routers with error handling
@@ -85,18 +88,24 @@ except Exception as e:
     print(f"Warning: Ticket attachments router not available: {e}")
     ticket_attachments_available = False
 
-# Import database connection
-try:
-    from bd.connection import create_db_and_tables
-    # Create tables
-    create_db_and_tables()
-    print("Database tables created successfully")
-except Exception as e:
-    print(f"Warning: Database connection not available: {e}")
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load OpenID Connect configuration and start background tasks on startup."""
+    # Resolve model relationships now instead of on the first request
+    try:
+        configure_mappers()
+    except Exception as e:
+        print(f"Warning: Could not configure model mappers: {e}")
+
+    # Create tables only for local development (other environments use the scripts in bd/sql)
+    if settings.ENVIRONMENT == EnvironmentMode.LOCAL:
+        try:
+            from bd.connection import create_db_and_tables
+            await asyncio.to_thread(create_db_and_tables)
+            print("Database tables created successfully")
+        except Exception as e:
+            print(f"Warning: Database connection not available: {e}")
+
     # Load Azure AD configuration
     try:
         await AZURE_AUTH_SCHEME.openid_config.load_config()
@@ -131,10 +140,22 @@ async def lifespan(app: FastAPI):
     except:
         pass
 
+    try:
+        from core.microsoft_graph import graph_client
+        await graph_client.aclose()
+    except:
+        pass
+
+    try:
+        await AZURE_AUTH_SCHEME.openid_config.aclose()
+    except:
+        pass
+
 app = FastAPI(
     title="PrimeFire API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     swagger_ui_oauth2_redirect_url="/docs/oauth2-redirect",
     swagger_ui_init_oauth={
         "usePkceWithAuthorizationCodeGrant": True,
@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel, Field
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime
+from bd.functions import utcnow
 
 class Curriculums(SQLModel, table=True):
     __tablename__ = "Curriculums"
@@ -14,6 +15,6 @@ class Curriculums(SQLModel, table=True):
     CurriculumPath: Optional[str] = Field(default=None, max_length=255)
     CoverLetter: Optional[str] = Field(default=None, max_length=1000)
     Status: str = Field(default="pending", max_length=20)
-    SubmittedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    SubmittedAt: datetime = Field(default=None, sa_column_kwargs={"server_default": utcnow(), "nullable": False})
     EmployeeId: Optional[int] = None
 
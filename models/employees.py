@@ -1,10 +1,11 @@
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
+from sqlalchemy import Index, text
 
 if TYPE_CHECKING:
     from models.countries import Countries
-    from models.modules import Modules
+    from models.tickets import Tickets
 
 class EmployeeRoles(SQLModel, table=True):
     __tablename__ = "EmployeeRoles"
@@ -29,7 +30,14 @@ class Roles(SQLModel, table=True):
 
 class Employees(SQLModel, table=True):
     __tablename__ = "Employees"
-    __table_args__ = {'schema': 'dbo'}
+    __table_args__ = (
+        # Email lookups (sync, login); not unique, since login and the Graph sync may both write the same address
+        Index("IX_Employees_Email", "Email", mssql_where=text("Email IS NOT NULL")),
+        Index("IX_Employees_AzureUpn", "AzureUpn"),
+        # Lets the sync find stale rows with a seek
+        Index("IX_Employees_LastSyncedAt", "LastSyncedAt"),
+        {'schema': 'dbo'},
+    )
 
     EmployeeId: Optional[int] = Field(default=None, primary_key=True, index=True)
 
@@ -41,26 +49,32 @@ class Employees(SQLModel, table=True):
     Department: Optional[str] = Field(default=None, max_length=50)
     Office: Optional[str] = Field(default=None, max_length=50)
     Email: Optional[str] = Field(default=None, max_length=50)
-    Phone: Optional[str] = Field(default=None, max_length=20)
-    MobilePhone: Optional[str] = Field(default=None, max_length=20)
-    OfficePhone: Optional[str] = Field(default=None, max_length=20)
+    Phone: Optional[str] = Field(default=None, max_length=24)
+    MobilePhone: Optional[str] = Field(default=None, max_length=24)
+    OfficePhone: Optional[str] = Field(default=None, max_length=24)
     
     # Address fields
     StreetAddress: Optional[str] = Field(default=None, max_length=100)
     City: Optional[str] = Field(default=None, max_length=50)
     State: Optional[str] = Field(default=None, max_length=50)
-    PostalCode: Optional[str] = Field(default=None, max_length=20)
+    PostalCode: Optional[str] = Field(default=None, max_length=16)
     
     # Internal fields
     CountryId: Optional[int] = Field(default=None, foreign_key="dbo.Countries.CountryId")
 
-    # Relationship to Countries
-    country: Optional["Countries"] = Relationship()
+    # List endpoints load roles explicitly with raiseload("*"): any other
+    # relationship touched while serializing a list fails loudly instead of running N+1 queries
 
-    # Many-to-many relationship with Roles through EmployeeRoles
+    # Relationship to Countries (many-to-one, loaded in the same query)
+    country: Optional["Countries"] = Relationship(
+        sa_relationship_kwargs={"lazy": "joined", "innerjoin": False}
+    )
+
+    # Many-to-many relationship with Roles through EmployeeRoles (one extra IN query per batch)
     roles: List["Roles"] = Relationship(
         back_populates="employees",
-        link_model=EmployeeRoles
+        link_model=EmployeeRoles,
+        sa_relationship_kwargs={"lazy": "selectin"}
     )
 
     # Azure AD fields for auto-registration
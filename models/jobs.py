@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel, Field
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime
+from bd.functions import utcnow
 
 class Jobs(SQLModel, table=True):
     __tablename__ = "Jobs"
@@ -14,6 +15,6 @@ class Jobs(SQLModel, table=True):
     SalaryMin: Optional[float] = None
     SalaryMax: Optional[float] = None
     Status: str = Field(default="active", max_length=20)
-    PostedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    PostedAt: datetime = Field(default=None, sa_column_kwargs={"server_default": utcnow(), "nullable": False})
     EmployeeId: Optional[int] = None
 
@@ -14,4 +14,4 @@ class Licenses(SQLModel, table=True):
     Key: Optional[str] = Field(default=None, max_length=50)
     Account: Optional[str] = Field(default=None, max_length=50)
     Password: Optional[str] = Field(default=None, max_length=50)
-    EmployeeId: Optional[int] = None
+    EmployeeId: Optional[int] = Field(default=None, index=True)
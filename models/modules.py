@@ -1,13 +1,14 @@
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List
 from datetime import datetime
+from bd.functions import utcnow
 
 class RoleModules(SQLModel, table=True):
     __tablename__ = "RoleModules"
     __table_args__ = {'schema': 'dbo'}
 
     RoleId: int = Field(foreign_key="dbo.Roles.RoleId", primary_key=True)
-    ModuleId: int = Field(foreign_key="dbo.Modules.ModuleId", primary_key=True)
+    ModuleId: int = Field(foreign_key="dbo.Modules.ModuleId", primary_key=True, index=True)
     CanView: bool = Field(default=True)
     CanCreate: bool = Field(default=False)
     CanEdit: bool = Field(default=False)
@@ -15,7 +16,7 @@ class RoleModules(SQLModel, table=True):
     CanExport: bool = Field(default=False)
     AdminActions: bool = Field(default=False)
     OtherActions: bool = Field(default=False)
-    AssignedAt: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    AssignedAt: Optional[datetime] = Field(default=None, sa_column_kwargs={"server_default": utcnow()})
 
 class Modules(SQLModel, table=True):
     __tablename__ = "Modules"
@@ -23,14 +24,14 @@ class Modules(SQLModel, table=True):
 
     ModuleId: Optional[int] = Field(default=None, primary_key=True, index=True)
     ModuleName: str = Field(max_length=50)
-    ModuleKey: str = Field(max_length=50, unique=True, index=True)
+    ModuleKey: str = Field(max_length=40, unique=True, index=True)
     Description: Optional[str] = Field(default=None, max_length=200)
     Icon: Optional[str] = Field(default=None, max_length=50)
     RouteUrl: Optional[str] = Field(default=None, max_length=100)
     DisplayOrder: Optional[int] = Field(default=0)
     IsActive: bool = Field(default=True)
     ParentModuleId: Optional[int] = Field(default=None, foreign_key="dbo.Modules.ModuleId")
-    CreatedAt: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    CreatedAt: Optional[datetime] = Field(default=None, sa_column_kwargs={"server_default": utcnow()})
 
     # Self-referential relationship for parent-child modules
     parent_module: Optional["Modules"] = Relationship(
@@ -1,29 +1,54 @@
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional
-from datetime import datetime, timezone
+from typing import Optional, List, TYPE_CHECKING
+from datetime import datetime
+from sqlalchemy import Index
+from bd.functions import utcnow
+
+if TYPE_CHECKING:
+    from models.tickets import Tickets
 
 
 class TicketMessages(SQLModel, table=True):
     __tablename__ = "ticketMessages"
-    __table_args__ = {'schema': 'dbo'}
+    __table_args__ = (
+        # Messages of a ticket in chronological order
+        Index("IX_ticketMessages_TicketId_CreatedAt", "TicketId", "CreatedAt"),
+        Index("IX_ticketMessages_UserId", "UserId"),
+        {'schema': 'dbo'},
+    )
 
     TicketMessageId: Optional[int] = Field(default=None, primary_key=True, index=True)
     TicketId: int = Field(foreign_key="dbo.Tickets.TicketId")
     UserId: int = Field(foreign_key="dbo.Employees.EmployeeId")
     MessageTxt: Optional[str] = Field(default=None)
-    CreatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    UpdatedAt: Optional[datetime] = None
+    CreatedAt: datetime = Field(default=None, sa_column_kwargs={"server_default": utcnow(), "nullable": False})
+    UpdatedAt: Optional[datetime] = Field(default=None, sa_column_kwargs={"onupdate": utcnow()})
     EditedAt: Optional[datetime] = None
 
+    # Relationships
+    ticket: Optional["Tickets"] = Relationship(back_populates="messages")
+    attachments: List["TicketAttachments"] = Relationship(
+        back_populates="message",
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
+
 
 class TicketAttachments(SQLModel, table=True):
     __tablename__ = "ticketAttachments"
-    __table_args__ = {'schema': 'dbo'}
+    __table_args__ = (
+        # Attachments of a ticket in chronological order
+        Index("IX_ticketAttachments_TicketId_CreatedAt", "TicketId", "CreatedAt"),
+        Index("IX_ticketAttachments_TicketMessageId", "TicketMessageId"),
+        {'schema': 'dbo'},
+    )
 
     TicketAttachmentId: Optional[int] = Field(default=None, primary_key=True, index=True)
     TicketId: int = Field(foreign_key="dbo.Tickets.TicketId")
     TicketMessageId: Optional[int] = Field(default=None, foreign_key="dbo.ticketMessages.TicketMessageId")
     FileName: str = Field(max_length=255)
     FileType: Optional[str] = Field(default=None, max_length=100)
-    FilePath: Optional[str] = Field(default=None, max_length=500)
-    CreatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    FilePath: Optional[str] = Field(default=None, max_length=260)
+    CreatedAt: datetime = Field(default=None, sa_column_kwargs={"server_default": utcnow(), "nullable": False})
+
+    # Relationships
+    message: Optional["TicketMessages"] = Relationship(back_populates="attachments")
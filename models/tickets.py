@@ -1,9 +1,14 @@
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional
-from datetime import datetime, timezone
-from sqlalchemy import Enum as SAEnum
+from typing import Optional, List, TYPE_CHECKING
+from datetime import datetime
+from sqlalchemy import Enum as SAEnum, Index, CheckConstraint
+from bd.functions import utcnow
 import enum
 
+if TYPE_CHECKING:
+    from models.employees import Employees
+    from models.ticket_messages import TicketMessages
+
 class TicketStatus(str, enum.Enum):
     TODO = "todo"
     ACTIVE = "active"
@@ -33,23 +38,31 @@ class TicketSLA(str, enum.Enum):
 
 class Tickets(SQLModel, table=True):
     __tablename__ = "Tickets"
-    __table_args__ = {'schema': 'dbo'}
+    __table_args__ = (
+        CheckConstraint(
+            "Status IN ('todo', 'active', 'inactive', 'closed', 'done', 'in_progress', 'on_hold')",
+            name="CK_Tickets_Status"
+        ),
+        CheckConstraint(
+            "Priority IN ('low', 'normal', 'medium', 'high', 'urgent')",
+            name="CK_Tickets_Priority"
+        ),
+        Index("IX_Tickets_Status", "Status"),
+        # Tickets created by / assigned to someone (optionally by status), newest first;
+        # AssignedTo-only lookups use the left prefix of the assignee index
+        Index("IX_Tickets_CreatedBy_CreatedAt", "CreatedBy", "CreatedAt"),
+        Index("IX_Tickets_AssignedTo_Status_CreatedAt", "AssignedTo", "Status", "CreatedAt"),
+        {'schema': 'dbo'},
+    )
 
     TicketId: Optional[int] = Field(default=None, primary_key=True, index=True)
     Title: str = Field(max_length=200)
     Description: Optional[str] = Field(default=None, max_length=2000)
 
-    # Status enum
-    Status: TicketStatus = Field(
-        default=TicketStatus.TODO,
-        sa_column=Field(sa_type=SAEnum(TicketStatus))
-    )
-
-    # Priority enum
-    Priority: TicketPriority = Field(
-        default=TicketPriority.NORMAL,
-        sa_column=Field(sa_type=SAEnum(TicketPriority))
-    )
+    # Status / Priority are stored as plain strings (TicketStatus / TicketPriority values)
+    # validated by the CHECK constraints; the schemas expose the enums
+    Status: str = Field(default=TicketStatus.TODO.value, max_length=20)
+    Priority: str = Field(default=TicketPriority.NORMAL.value, max_length=20)
 
     # SLA enum (optional)
     SLA: Optional[TicketSLA] = Field(
@@ -61,18 +74,24 @@ class Tickets(SQLModel, table=True):
     CreatedBy: int = Field(foreign_key="dbo.Employees.EmployeeId")  # Required
     AssignedTo: Optional[int] = Field(default=None, foreign_key="dbo.Employees.EmployeeId")  # Optional
 
-    # Timestamps
-    CreatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    UpdatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Timestamps (set by the database)
+    CreatedAt: datetime = Field(default=None, sa_column_kwargs={"server_default": utcnow(), "nullable": False})
+    UpdatedAt: datetime = Field(default=None, sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow(), "nullable": False})
 
-    # Relationships
+    # Relationships (many-to-one, loaded in the same query)
+    # GET /tickets loads creator/assignee explicitly with raiseload("*"); other relationships raise there
     creator: Optional["Employees"] = Relationship(
         back_populates="created_tickets",
-        sa_relationship_kwargs={"foreign_keys": "Tickets.CreatedBy"}
+        sa_relationship_kwargs={"foreign_keys": "Tickets.CreatedBy", "lazy": "joined"}
     )
     assignee: Optional["Employees"] = Relationship(
         back_populates="assigned_tickets",
-        sa_relationship_kwargs={"foreign_keys": "Tickets.AssignedTo"}
+        sa_relationship_kwargs={"foreign_keys": "Tickets.AssignedTo", "lazy": "joined"}
+    )
+    # Lazy by default (ticket lists don't embed messages); the DB rejects deleting a ticket with messages
+    messages: List["TicketMessages"] = Relationship(
+        back_populates="ticket",
+        sa_relationship_kwargs={"passive_deletes": True}
     )
 
 
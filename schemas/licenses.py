@@ -1,5 +1,4 @@
 from sqlmodel import SQLModel
-from models.licenses import Licenses
 from typing import Optional
 from datetime import date
 
@@ -26,8 +25,16 @@ class LicenseUpdate(SQLModel):
     
     
 
-# Schema for response (all fields)
-class License(Licenses):
-    pass
+# Schema for response (all fields, read from the Licenses table model)
+class License(SQLModel):
+    LicenseId: int
+    Software: Optional[str] = None
+    Version: Optional[str] = None
+    CreatedAt: Optional[date] = None
+    ExpiryDate: Optional[date] = None
+    Key: Optional[str] = None
+    Account: Optional[str] = None
+    Password: Optional[str] = None
+    EmployeeId: Optional[int] = None
 
 
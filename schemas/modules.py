@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
@@ -7,7 +7,7 @@ from datetime import datetime
 # ----------------------------
 class ModuleBase(BaseModel):
     ModuleName: str = Field(..., max_length=50, description="Name of the module")
-    ModuleKey: str = Field(..., max_length=50, description="Unique key identifier for the module")
+    ModuleKey: str = Field(..., max_length=40, description="Unique key identifier for the module")
     Description: Optional[str] = Field(None, max_length=200, description="Module description")
     Icon: Optional[str] = Field(None, max_length=50, description="Material icon name")
     RouteUrl: Optional[str] = Field(None, max_length=100, description="Angular route URL")
@@ -20,7 +20,7 @@ class ModuleCreate(ModuleBase):
 
 class ModuleUpdate(BaseModel):
     ModuleName: Optional[str] = Field(None, max_length=50)
-    ModuleKey: Optional[str] = Field(None, max_length=50)
+    ModuleKey: Optional[str] = Field(None, max_length=40)
     Description: Optional[str] = Field(None, max_length=200)
     Icon: Optional[str] = Field(None, max_length=50)
     RouteUrl: Optional[str] = Field(None, max_length=100)
@@ -32,8 +32,11 @@ class Module(ModuleBase):
     ModuleId: int
     CreatedAt: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+class ModuleTree(Module):
+    """Module with its nested child modules"""
+    children: List["ModuleTree"] = []
 
 # ----------------------------
 # 📌 PERMISSION SCHEMAS (RoleModules)
@@ -64,8 +67,7 @@ class PermissionUpdate(BaseModel):
 class Permission(PermissionBase):
     AssignedAt: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # ----------------------------
 # 📌 EXTENDED SCHEMAS WITH RELATIONSHIPS
@@ -1,42 +1,53 @@
 from sqlmodel import SQLModel
-from typing import Optional
+from typing import Annotated, Optional
 from datetime import datetime
 from models.tickets import TicketStatus, TicketPriority, TicketSLA
-from pydantic import field_validator
+from pydantic import BeforeValidator, ConfigDict
+from pydantic.dataclasses import dataclass
+import dataclasses
+from fastapi import Query
+
+def _empty_to_none(value):
+    """Treat an empty string as no value (lets clients clear SLA with "")"""
+    return None if value == "" else value
+
+# Enum fields keep their plain string value (what the Status/Priority/SLA columns store)
+ENUM_VALUES_CONFIG = ConfigDict(use_enum_values=True)
 
 # Schema for creating tickets
 class TicketCreate(SQLModel):
+    model_config = ENUM_VALUES_CONFIG
+
     Title: str
     Description: Optional[str] = None
-    Status: TicketStatus = TicketStatus.TODO
-    Priority: TicketPriority = TicketPriority.NORMAL
+    Status: TicketStatus = TicketStatus.TODO.value
+    Priority: TicketPriority = TicketPriority.NORMAL.value
     SLA: Optional[TicketSLA] = None  # Service Level Agreement
     AssignedTo: Optional[int] = None  # EmployeeId to assign ticket to
 
 # Schema for updating tickets (partial updates allowed)
 class TicketUpdate(SQLModel):
+    model_config = ENUM_VALUES_CONFIG
+
     Title: Optional[str] = None
     Description: Optional[str] = None
     Status: Optional[TicketStatus] = None
     Priority: Optional[TicketPriority] = None
-    SLA: Optional[TicketSLA] = None  # Service Level Agreement (can be None to clear)
+    SLA: Annotated[Optional[TicketSLA], BeforeValidator(_empty_to_none)] = None  # Service Level Agreement (can be None to clear)
     AssignedTo: Optional[int] = None  # Can be None to unassign
 
-    @field_validator('SLA', mode='before')
-    def validate_sla(cls, v):
-        if v == "":
-            return None
-        return v
-
+# Response-only schemas (never persisted) are slotted pydantic dataclasses
 # Schema for simplified employee info in ticket responses
-class TicketEmployee(SQLModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TicketEmployee:
     EmployeeId: int
     DisplayName: Optional[str] = None
     Email: Optional[str] = None
     Title: Optional[str] = None
 
 # Schema for ticket response with related data
-class Ticket(SQLModel):
+@dataclass(slots=True, frozen=True, kw_only=True, config=ENUM_VALUES_CONFIG)
+class Ticket:
     TicketId: Optional[int] = None
     Title: str
     Description: Optional[str] = None
@@ -52,14 +63,12 @@ class Ticket(SQLModel):
     creator: Optional[TicketEmployee] = None
     assignee: Optional[TicketEmployee] = None
 
-# Schema for ticket filters/pagination
-class TicketFilters(SQLModel):
-    status: Optional[TicketStatus] = None
-    priority: Optional[TicketPriority] = None
-    sla: Optional[TicketSLA] = None  # Service Level Agreement filter
-    assigned_to: Optional[int] = None  # EmployeeId
-    created_by: Optional[int] = None   # EmployeeId
-    search: Optional[str] = None        # Search in title/description
-
-
-
+# Schema for ticket filters (bound from the query string of GET /tickets)
+@dataclasses.dataclass(slots=True, frozen=True)
+class TicketFilters:
+    status: Annotated[Optional[TicketStatus], Query(description="Filter by ticket status")] = None
+    priority: Annotated[Optional[TicketPriority], Query(description="Filter by ticket priority")] = None
+    sla: Annotated[Optional[TicketSLA], Query(description="Filter by service level agreement")] = None
+    assigned_to: Annotated[Optional[int], Query(description="Filter by assigned employee ID")] = None
+    created_by: Annotated[Optional[int], Query(description="Filter by creator employee ID")] = None
+    search: Annotated[Optional[str], Query(description="Search in title and description")] = None
@@ -1,87 +1,185 @@
+import jwt
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, Session, create_engine
-import os
 
 from main import app
 from bd.connection import engine
 from bd.dependencies import get_db
+from core.config import settings
 
 # Import models to register them with SQLModel metadata
 from models.employees import Employees
+from models.jobs import Jobs
 from models.licenses import Licenses
 
 
-# Test database URL (using SQLite for tests)
-TEST_DATABASE_URL = "sqlite:///./test.db"
+# Test database URL (in-memory SQLite for tests)
+TEST_DATABASE_URL = "sqlite://"
 
-# Create test engine
-test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+# Create test engine (StaticPool keeps the single in-memory connection shared by all sessions)
+# pytest-xdist workers are separate processes, so each one gets its own in-memory database
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
 
 
-@pytest.fixture(scope="function")
-def db_session():
+# Session factory for tests, bound per test to the test connection
+# Commits inside a test only release a SAVEPOINT of the test transaction
+TestSession = sessionmaker(class_=Session, join_transaction_mode="create_savepoint")
+
+
+@event.listens_for(test_engine, "connect")
+def attach_dbo_schema(dbapi_connection, connection_record):
+    """Models live in the 'dbo' schema; SQLite needs it attached as a database."""
+    dbapi_connection.execute("ATTACH DATABASE ':memory:' AS dbo")
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine, "begin")
+def begin_transaction(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_database():
     """
-    Create a fresh database session for each test.
+    Create the test database tables once for the entire test session.
     """
-    # Create all tables
     SQLModel.metadata.create_all(bind=test_engine)
 
-    # Create a new session
-    with Session(test_engine) as db:
+    yield
+
+    SQLModel.metadata.drop_all(bind=test_engine)
+
+
+@pytest.fixture(scope="function")
+def connection():
+    """
+    Open a transaction that is rolled back after each test.
+    Sessions bound to it commit into SAVEPOINTs, so nothing outlives the test.
+    """
+    with test_engine.connect() as conn:
+        transaction = conn.begin()
         try:
-            yield db
+            yield conn
         finally:
-            db.rollback()
+            transaction.rollback()
 
-    # Drop all tables after test
-    SQLModel.metadata.drop_all(bind=test_engine)
+
+@pytest.fixture(scope="function")
+def sql_statements(connection):
+    """
+    Collect the SQL statements sent on the test connection (clear it before the call under test).
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", record)
+    yield statements
+    event.remove(connection, "before_cursor_execute", record)
 
 
 @pytest.fixture(scope="function")
-def client():
+def db_session(connection):
     """
-    Create a test client for the FastAPI app.
+    Create a database session for each test, isolated by the test transaction.
+    """
+    with TestSession(bind=connection) as db:
+        yield db
+
+
+@pytest.fixture(scope="session")
+def _client():
+    """
+    Create the test client once; the app lifespan runs a single time per session.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def client(_client, connection):
+    """
+    Test client with the database dependency bound to the test transaction.
     """
-    # Create all tables before test
-    SQLModel.metadata.create_all(bind=test_engine)
-    
-    # Override the database dependency to use test database
     def override_get_db():
-        with Session(test_engine) as db:
-            try:
-                yield db
-            finally:
-                db.rollback()
+        db = TestSession(bind=connection)
+        try:
+            yield db
+        finally:
+            db.close()
 
     # Override the database dependency in the app
     app.dependency_overrides[get_db] = override_get_db
 
-    # Create test client
-    with TestClient(app) as test_client:
-        yield test_client
+    yield _client
 
-    # Clear overrides after test
-    app.dependency_overrides.clear()
-    
-    # Drop all tables after test
-    SQLModel.metadata.drop_all(bind=test_engine)
+    # Remove the override after test
+    app.dependency_overrides.pop(get_db, None)
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_database():
+@pytest.fixture(scope="session")
+def auth_headers():
     """
-    Setup and teardown for the entire test session.
+    Bearer token accepted by the API's token validator, minted once per test session.
     """
-    # Create test database tables
-    SQLModel.metadata.create_all(bind=test_engine)
+    token = jwt.encode(
+        {
+            "aud": f"api://{settings.BACKEND_CLIENT_ID}",
+            "iss": f"https://sts.windows.net/{settings.TENANT_ID}/",
+            "oid": "00000000-0000-0000-0000-000000000001",
+            "upn": "test.user@example.com",
+            "name": "Test User",
+        },
+        # The validator does not check signatures; any HMAC key works
+        "primefire-tests-signing-key-0123456789",
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _job_row(**overrides) -> dict:
+    """Column values of a test job (keyword arguments replace the defaults)"""
+    return {
+        "Title": "Test Job",
+        "Description": "Test description",
+        "Requirements": "Test requirements",
+        "Location": "Test location",
+        "SalaryMin": 40000.0,
+        "SalaryMax": 60000.0,
+        "Status": "active",
+        "EmployeeId": 2,
+        **overrides,
+    }
+
+
+@pytest.fixture(scope="session")
+def job_row():
+    """
+    Factory for the column values of a test job, e.g. job_row(Title="Job 1").
+    """
+    return _job_row
 
-    yield
 
-    # Clean up test database file
-    try:
-        if os.path.exists("./test.db"):
-            os.remove("./test.db")
-    except PermissionError:
-        # If we can't delete it now, try again later
-        pass
+@pytest.fixture(scope="function")
+def create_jobs(db_session):
+    """
+    Factory that inserts test jobs with a single flush, one per dict of column overrides.
+    create_jobs() inserts one default job.
+    """
+    def create(*overrides: dict) -> list[Jobs]:
+        jobs = [Jobs(**_job_row(**values)) for values in (overrides or ({},))]
+        db_session.add_all(jobs)
+        db_session.flush()
+        return jobs
+
+    return create
@@ -0,0 +1,118 @@
+import asyncio
+import inspect
+import json
+import time
+from importlib.metadata import version
+from pathlib import Path
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi_azure_auth.openid_config import OpenIdConfig
+
+from core.azure_auth import CachedAzureAuthorizationCodeBearer, PooledOpenIdConfig
+
+_CONFIG_URL = "https://login.example.com/tenant/v2.0/.well-known/openid-configuration"
+_JWKS_URL = "https://login.example.com/tenant/discovery/v2.0/keys"
+
+
+def _signing_jwk(kid: str) -> dict:
+    """Build a public RSA signing JWK with the given kid"""
+    public_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).public_key()
+    return {**json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(public_key)), "kid": kid, "use": "sig"}
+
+
+def _mock_transport(requests: list) -> httpx.MockTransport:
+    """Serve a discovery document and a JWKS holding one signing and one encryption key"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        if request.url.path.endswith("openid-configuration"):
+            return httpx.Response(200, json={
+                "authorization_endpoint": "https://login.example.com/authorize",
+                "token_endpoint": "https://login.example.com/token",
+                "issuer": "https://login.example.com/tenant/v2.0",
+                "jwks_uri": _JWKS_URL,
+            })
+        return httpx.Response(200, json={"keys": [_signing_jwk("sig-key"), {**_signing_jwk("enc-key"), "use": "enc"}]})
+    return httpx.MockTransport(handler)
+
+
+class TestPooledOpenIdConfig:
+    """PooledOpenIdConfig overrides private fastapi-azure-auth methods, so it is pinned and exercised here"""
+
+    def test_fastapi_azure_auth_is_pinned(self):
+        """The installed fastapi-azure-auth is the release the overrides mirror"""
+        requirements = (Path(__file__).resolve().parents[1] / "requirements.txt").read_text().splitlines()
+        assert "fastapi-azure-auth==5.2.0" in requirements
+        assert version("fastapi-azure-auth") == "5.2.0"
+
+    def test_overrides_library_hooks(self):
+        """load_config() still reaches the overridden private hooks"""
+        assert inspect.iscoroutinefunction(OpenIdConfig._load_openid_config)
+        assert PooledOpenIdConfig._load_openid_config is not OpenIdConfig._load_openid_config
+        assert PooledOpenIdConfig._load_keys is not OpenIdConfig._load_keys
+
+    def test_load_config_uses_shared_client(self):
+        """The public load_config() fills the config through the injected client"""
+        requests = []
+        client = httpx.AsyncClient(transport=_mock_transport(requests))
+        config = PooledOpenIdConfig(tenant_id="tenant", app_id="app-id", config_url=_CONFIG_URL, http_client=client)
+
+        async def load_twice():
+            await config.load_config()
+            # Force a refresh: the same client must serve it
+            config._config_timestamp = None
+            await config.load_config()
+            assert not client.is_closed
+            await config.aclose()
+
+        asyncio.run(load_twice())
+
+        assert requests == [f"{_CONFIG_URL}?appid=app-id", _JWKS_URL] * 2
+        assert config.issuer == "https://login.example.com/tenant/v2.0"
+        assert config.token_endpoint == "https://login.example.com/token"
+        assert list(config.signing_keys) == ["sig-key"]
+        assert client.is_closed
+
+
+class TestCachedAzureAuthorizationCodeBearer:
+    """Claims cache on the Azure bearer scheme"""
+
+    _ISSUER = "https://login.example.com/tenant/v2.0"
+    _OPTIONS = {"verify_signature": True, "verify_iss": True, "require": ["exp", "iss"]}
+
+    def _signed_token(self, private_key) -> str:
+        """Sign a short-lived token for the test audience and issuer"""
+        now = int(time.time())
+        claims = {"aud": "api://test", "iss": self._ISSUER, "sub": "user", "iat": now, "nbf": now, "exp": now + 300}
+        return jwt.encode(claims, private_key, algorithm="RS256")
+
+    def test_keeps_openid_settings(self):
+        """The pooled config keeps every setting of the config the library built"""
+        scheme = CachedAzureAuthorizationCodeBearer(
+            app_client_id="app-id",
+            tenant_id="tenant",
+            openid_config_use_app_id=True,
+        )
+        assert isinstance(scheme.openid_config, PooledOpenIdConfig)
+        assert scheme.openid_config.tenant_id == "tenant"
+        assert scheme.openid_config.app_id == "app-id"
+        assert scheme.openid_config.config_url is None
+        assert scheme.openid_config.multi_tenant is False
+
+    def test_cache_depends_on_key_and_issuer(self):
+        """Cached claims are only reused for the same signing key, issuer and options"""
+        scheme = CachedAzureAuthorizationCodeBearer(app_client_id="api://test", tenant_id="tenant")
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        rotated_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).public_key()
+        token = self._signed_token(private_key)
+
+        claims = scheme.validate(access_token=token, key=private_key.public_key(), iss=self._ISSUER, options=self._OPTIONS)
+        assert claims["sub"] == "user"
+        assert len(scheme._claims_cache) == 1
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            scheme.validate(access_token=token, key=rotated_key, iss=self._ISSUER, options=self._OPTIONS)
+        with pytest.raises(jwt.InvalidIssuerError):
+            scheme.validate(access_token=token, key=private_key.public_key(), iss="https://other.example.com", options=self._OPTIONS)
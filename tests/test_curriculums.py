@@ -1,18 +1,20 @@
 """
 Tests for Curriculums API endpoints.
 
-Note: All tests that create files automatically clean up after themselves
-to avoid leaving test artifacts in the uploads/curriculums directory.
+Note: Tests that upload files redirect the upload directory to pytest's
+tmp_path, so no test artifacts are left in uploads/curriculums.
 """
 import pytest
-import io
 from pathlib import Path
-from sqlmodel import Session, select
+from sqlmodel import Session, select, insert
 
 from models.curriculums import Curriculums
 from models.jobs import Jobs
 from schemas.curriculums import CurriculumCreate
 
+# Minimal one-page PDF used as the uploaded resume
+_PDF_BYTES = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n3 0 obj\n<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n/Contents 4 0 R\n>>\nendobj\n4 0 obj\n<<\n/Length 44\n>>\nstream\nBT\n/F1 12 Tf\n100 700 Td\n(Hello World) Tj\nET\nendstream\nendobj\nxref\n0 5\n0000000000 65535 f \n0000000010 00000 n \n0000000053 00000 n \n0000000125 00000 n \n0000000205 00000 n \ntrailer\n<<\n/Size 5\n/Root 1 0 R\n>>\nstartxref\n297\n%%EOF"
+
 
 class TestCurriculumsAPI:
     """Test cases for Curriculums API endpoints"""
@@ -25,15 +27,13 @@ class TestCurriculumsAPI:
         assert isinstance(data, list)
         assert len(data) == 0
 
-    def test_create_curriculum_with_file(self, client, db_session: Session):
+    def test_create_curriculum_with_file(self, client, create_jobs, tmp_path: Path, monkeypatch):
         """Test POST /curriculums/upload creates a new curriculum with file upload"""
-        # Create a test job first
-        job = self._create_test_job(db_session)
+        # Save uploads under tmp_path (removed by pytest)
+        monkeypatch.setattr("api.curriculums.UPLOAD_DIR", tmp_path)
 
-        # Create a mock PDF file
-        pdf_content = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n3 0 obj\n<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n/Contents 4 0 R\n>>\nendobj\n4 0 obj\n<<\n/Length 44\n>>\nstream\nBT\n/F1 12 Tf\n100 700 Td\n(Hello World) Tj\nET\nendstream\nendobj\nxref\n0 5\n0000000000 65535 f \n0000000010 00000 n \n0000000053 00000 n \n0000000125 00000 n \n0000000205 00000 n \ntrailer\n<<\n/Size 5\n/Root 1 0 R\n>>\nstartxref\n297\n%%EOF"
-        pdf_file = io.BytesIO(pdf_content)
-        pdf_file.name = "test_resume.pdf"
+        # Create a test job first
+        job = create_jobs()[0]
 
         # Prepare form data
         form_data = {
@@ -46,7 +46,7 @@ class TestCurriculumsAPI:
         }
 
         # Create files dict for the test
-        files = {"resume_file": ("test_resume.pdf", pdf_file, "application/pdf")}
+        files = {"resume_file": ("test_resume.pdf", _PDF_BYTES, "application/pdf")}
 
         response = client.post("/curriculums/upload", data=form_data, files=files)
         assert response.status_code == 200
@@ -61,15 +61,12 @@ class TestCurriculumsAPI:
         assert data["CurriculumId"] is not None
         assert data["CurriculumPath"] is not None
         assert "uploads/curriculums/" in data["CurriculumPath"]
+        assert (tmp_path / Path(data["CurriculumPath"]).name).read_bytes() == _PDF_BYTES
 
-        # Cleanup: delete the uploaded file to avoid leaving test artifacts
-        if data["CurriculumPath"] and Path(data["CurriculumPath"]).exists():
-            Path(data["CurriculumPath"]).unlink()
-
-    def test_create_curriculum_simple(self, client, db_session: Session):
+    def test_create_curriculum_simple(self, client, create_jobs):
         """Test POST /curriculums/ creates a new curriculum without file"""
         # Create a test job first
-        job = self._create_test_job(db_session)
+        job = create_jobs()[0]
 
         curriculum_data = {
             "JobId": job.JobId,
@@ -93,10 +90,10 @@ class TestCurriculumsAPI:
         assert data["JobId"] == job.JobId
         assert data["CurriculumId"] is not None
 
-    def test_get_curriculum_by_id(self, client, db_session: Session):
+    def test_get_curriculum_by_id(self, client, db_session: Session, create_jobs):
         """Test GET /curriculums/{curriculum_id} returns specific curriculum"""
         # Create test data
-        curriculum = self._create_test_curriculum(db_session)
+        curriculum = self._create_test_curriculum(db_session, create_jobs()[0].JobId)
 
         response = client.get(f"/curriculums/{curriculum.CurriculumId}")
         assert response.status_code == 200
@@ -113,34 +110,41 @@ class TestCurriculumsAPI:
         data = response.json()
         assert "Curriculum not found" in data["detail"]
 
-    def test_get_curriculums_by_job(self, client, db_session: Session):
+    def test_get_curriculums_by_job(self, client, db_session: Session, job_row):
         """Test GET /curriculums/job/{job_id} returns curriculums for specific job"""
-        # Create test job and curriculums
-        job1 = self._create_test_job(db_session, "Job 1")
-        job2 = self._create_test_job(db_session, "Job 2")
-
-        self._create_test_curriculum(db_session, job1.JobId, "John Doe")
-        self._create_test_curriculum(db_session, job1.JobId, "Jane Smith")
-        self._create_test_curriculum(db_session, job2.JobId, "Bob Johnson")
-
-        response = client.get(f"/curriculums/job/{job1.JobId}")
+        # Create test jobs and curriculums with one multi-row INSERT each
+        job_ids = dict(db_session.exec(
+            insert(Jobs).returning(Jobs.Title, Jobs.JobId),
+            params=[job_row(Title="Job 1"), job_row(Title="Job 2")]
+        ).all())
+        job1_id, job2_id = job_ids["Job 1"], job_ids["Job 2"]
+
+        db_session.exec(insert(Curriculums), params=[
+            self._curriculum_row(job1_id, "John Doe"),
+            self._curriculum_row(job1_id, "Jane Smith"),
+            self._curriculum_row(job2_id, "Bob Johnson"),
+        ])
+
+        response = client.get(f"/curriculums/job/{job1_id}")
         assert response.status_code == 200
 
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 2
-        assert all(c["JobId"] == job1.JobId for c in data)
+        assert all(c["JobId"] == job1_id for c in data)
 
         names = [c["Name"] for c in data]
         assert "John Doe" in names
         assert "Jane Smith" in names
 
-    def test_get_curriculums_by_status(self, client, db_session: Session):
+    def test_get_curriculums_by_status(self, client, db_session: Session, create_jobs):
         """Test GET /curriculums/status/{status} returns curriculums by status"""
         # Create test data
-        job = self._create_test_job(db_session)
-        self._create_test_curriculum(db_session, job.JobId, "Pending Curriculum", "pending")
-        self._create_test_curriculum(db_session, job.JobId, "Reviewed Curriculum", "reviewed")
+        job = create_jobs()[0]
+        self._bulk_create_curriculums(db_session, [
+            {"job_id": job.JobId, "name": "Pending Curriculum", "status": "pending"},
+            {"job_id": job.JobId, "name": "Reviewed Curriculum", "status": "reviewed"},
+        ])
 
         response = client.get("/curriculums/status/pending")
         assert response.status_code == 200
@@ -150,10 +154,10 @@ class TestCurriculumsAPI:
         assert len(data) >= 1
         assert all(c["Status"] == "pending" for c in data)
 
-    def test_update_curriculum(self, client, db_session: Session):
+    def test_update_curriculum(self, client, db_session: Session, create_jobs):
         """Test PUT /curriculums/{curriculum_id} updates curriculum"""
         # Create test data
-        curriculum = self._create_test_curriculum(db_session)
+        curriculum = self._create_test_curriculum(db_session, create_jobs()[0].JobId)
 
         update_data = {
             "Name": "Updated Name",
@@ -171,14 +175,10 @@ class TestCurriculumsAPI:
         assert data["Status"] == "reviewed"
         assert data["CoverLetter"] == "Updated cover letter"
 
-    def test_delete_curriculum(self, client, db_session: Session):
+    def test_delete_curriculum(self, client, db_session: Session, create_jobs):
         """Test DELETE /curriculums/{curriculum_id} deletes curriculum"""
         # Create test data
-        curriculum = self._create_test_curriculum(db_session)
-
-        # Verify curriculum exists
-        response = client.get(f"/curriculums/{curriculum.CurriculumId}")
-        assert response.status_code == 200
+        curriculum = self._create_test_curriculum(db_session, create_jobs()[0].JobId)
 
         # Delete curriculum
         response = client.delete(f"/curriculums/{curriculum.CurriculumId}")
@@ -186,45 +186,32 @@ class TestCurriculumsAPI:
         data = response.json()
         assert "Curriculum deleted successfully" in data["detail"]
 
-        # Verify curriculum is deleted
-        response = client.get(f"/curriculums/{curriculum.CurriculumId}")
-        assert response.status_code == 404
+        # Verify curriculum is deleted (straight from the database; GET is covered by its own tests)
+        assert db_session.exec(select(Curriculums).where(Curriculums.CurriculumId == curriculum.CurriculumId)).first() is None
 
-    def _create_test_job(self, db_session: Session, title: str = "Test Job") -> Jobs:
-        """Helper method to create a test job"""
-        job = Jobs(
-            Title=title,
-            Description="Test description",
-            Requirements="Test requirements",
-            Location="Test location",
-            SalaryMin=40000.0,
-            SalaryMax=60000.0,
-            Status="active",
-            EmployeeId=2
-        )
-        db_session.add(job)
-        db_session.commit()
-        db_session.refresh(job)
-        return job
-
-    def _create_test_curriculum(self, db_session: Session, job_id: int = None, name: str = "Test Applicant", status: str = "pending") -> Curriculums:
+    def _create_test_curriculum(self, db_session: Session, job_id: int, name: str = "Test Applicant", status: str = "pending") -> Curriculums:
         """Helper method to create a test curriculum"""
-        if job_id is None:
-            job = self._create_test_job(db_session)
-            job_id = job.JobId
-
-        curriculum = Curriculums(
-            JobId=job_id,
-            Name=name,
-            Email=f"{name.lower().replace(' ', '.')}@example.com",
-            Phone="+1234567890",
-            CurriculumPath="/uploads/curriculums/test.pdf",
-            CoverLetter="Test cover letter",
-            Status=status,
-            EmployeeId=None
-        )
-        db_session.add(curriculum)
-        db_session.commit()
-        db_session.refresh(curriculum)
-        return curriculum
-
+        return self._bulk_create_curriculums(db_session, [{"job_id": job_id, "name": name, "status": status}])[0]
+
+    def _bulk_create_curriculums(self, db_session: Session, specs: list[dict]) -> list[Curriculums]:
+        """Helper method to create several test curriculums with a single flush (specs: job_id, name, status)"""
+        curriculums = [
+            Curriculums(**self._curriculum_row(spec["job_id"], spec.get("name", "Test Applicant"), spec.get("status", "pending")))
+            for spec in specs
+        ]
+        db_session.add_all(curriculums)
+        db_session.flush()
+        return curriculums
+
+    def _curriculum_row(self, job_id: int, name: str = "Test Applicant", status: str = "pending") -> dict:
+        """Column values of a test curriculum"""
+        return {
+            "JobId": job_id,
+            "Name": name,
+            "Email": f"{name.lower().replace(' ', '.')}@example.com",
+            "Phone": "+1234567890",
+            "CurriculumPath": "/uploads/curriculums/test.pdf",
+            "CoverLetter": "Test cover letter",
+            "Status": status,
+            "EmployeeId": None
+        }
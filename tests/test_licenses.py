@@ -1,10 +1,23 @@
 import pytest
 from datetime import date
-from sqlmodel import Session
+from sqlmodel import Session, select
 
+from api.licenses import get_licenses
 from models.licenses import Licenses
 from schemas.licenses import LicenseCreate
 
+_EXPIRY_DATE = date(2024, 12, 31)
+
+_DEFAULT_LICENSE_PAYLOAD = {
+    "Software": "Visual Studio Code",
+    "Version": "1.85.0",
+    "ExpiryDate": _EXPIRY_DATE.isoformat(),
+    "Key": "XXXXX-XXXXX-XXXXX-XXXXX-XXXXX",
+    "Account": "license@company.com",
+    "Password": "password123",
+    "EmployeeId": 1
+}
+
 
 class TestLicensesAPI:
     """Test cases for Licenses API endpoints"""
@@ -17,30 +30,14 @@ class TestLicensesAPI:
         assert isinstance(data, list)
         assert len(data) == 0
 
-    def test_create_license(self, client, db_session: Session):
-        """Test POST /licenses/ creates a new license"""
-        # First create an employee (required for license)
-        from models.employees import Employees
-        employee = Employees(
-            Name="Test Employee",
-            Role="Developer",
-            Email="test@example.com",
-            EmployeeId=1
-        )
-        db_session.add(employee)
-        db_session.commit()
-
-        license_data = {
-            "Software": "Visual Studio Code",
-            "Version": "1.85.0",
-            "ExpiryDate": "2024-12-31",
-            "Key": "XXXXX-XXXXX-XXXXX-XXXXX-XXXXX",
-            "Account": "license@company.com",
-            "Password": "password123",
-            "EmployeeId": 1
-        }
+    def test_get_licenses_handler_empty(self, db_session: Session):
+        """Test the GET /licenses/ handler query on its own, without routing or serialization"""
+        data = get_licenses(skip=0, limit=None, db=db_session, _auth=None)
+        assert data == []
 
-        response = client.post("/licenses/", json=license_data)
+    def test_create_license(self, client):
+        """Test POST /licenses/ creates a new license"""
+        response = client.post("/licenses/", json=_DEFAULT_LICENSE_PAYLOAD)
         assert response.status_code == 200
 
         data = response.json()
@@ -55,8 +52,7 @@ class TestLicensesAPI:
     def test_get_license_by_id(self, client, db_session: Session):
         """Test GET /licenses/{license_id} returns specific license"""
         # Create test data
-        employee = self._create_test_employee(db_session)
-        license_obj = self._create_test_license(db_session, employee.EmployeeId)
+        license_obj = self._create_test_license(db_session, 1)
 
         response = client.get(f"/licenses/{license_obj.LicenseId}")
         assert response.status_code == 200
@@ -72,30 +68,47 @@ class TestLicensesAPI:
         data = response.json()
         assert "License not found" in data["detail"]
 
-    def test_get_all_licenses(self, client, db_session: Session):
-        """Test GET /licenses/ returns all licenses"""
+    def test_get_all_licenses(self, client, db_session: Session, sql_statements: list):
+        """Test GET /licenses/ returns all licenses with a single SELECT"""
         # Create test data
-        employee = self._create_test_employee(db_session)
-        self._create_test_license(db_session, employee.EmployeeId)
-        self._create_test_license(db_session, employee.EmployeeId, software="Office 365")
+        self._seed(
+            db_session,
+            licenses=[
+                self._license(1),
+                self._license(2, software="Office 365"),
+                *(self._license(license_id) for license_id in range(3, 21)),
+            ],
+        )
 
+        sql_statements.clear()
         response = client.get("/licenses/")
         assert response.status_code == 200
 
+        # Listing must not load anything per row (N+1)
+        selects = [statement for statement in sql_statements if statement.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) == 2
+        assert len(data) == 20
 
-        # Check that both licenses are present
+        # Both software names seeded above come back (19 x Visual Studio Code, 1 x Office 365)
         software_names = [license["Software"] for license in data]
         assert "Visual Studio Code" in software_names
         assert "Office 365" in software_names
 
+    def test_get_licenses_page(self, client, db_session: Session):
+        """Test GET /licenses/ with skip/limit returns one page in LicenseId order"""
+        self._seed(db_session, licenses=[self._license(license_id) for license_id in range(1, 21)])
+
+        response = client.get("/licenses/", params={"skip": 5, "limit": 10})
+        assert response.status_code == 200
+        assert [license["LicenseId"] for license in response.json()] == list(range(6, 16))
+
     def test_update_license(self, client, db_session: Session):
         """Test PUT /licenses/{license_id} updates license"""
         # Create test data
-        employee = self._create_test_employee(db_session)
-        license_obj = self._create_test_license(db_session, employee.EmployeeId)
+        self._seed(db_session, licenses=[self._license(1)])
 
         update_data = {
             "Software": "Updated Software",
@@ -106,7 +119,7 @@ class TestLicensesAPI:
             "EmployeeId": 1
         }
 
-        response = client.put(f"/licenses/{license_obj.LicenseId}", json=update_data)
+        response = client.put("/licenses/1", json=update_data)
         assert response.status_code == 200
 
         data = response.json()
@@ -133,22 +146,20 @@ class TestLicensesAPI:
     def test_delete_license(self, client, db_session: Session):
         """Test DELETE /licenses/{license_id} deletes license"""
         # Create test data
-        employee = self._create_test_employee(db_session)
-        license_obj = self._create_test_license(db_session, employee.EmployeeId)
+        self._seed(db_session, licenses=[self._license(1)])
 
         # Verify license exists
-        response = client.get(f"/licenses/{license_obj.LicenseId}")
+        response = client.get("/licenses/1")
         assert response.status_code == 200
 
         # Delete license
-        response = client.delete(f"/licenses/{license_obj.LicenseId}")
+        response = client.delete("/licenses/1")
         assert response.status_code == 200
         data = response.json()
         assert "License deleted successfully" in data["message"]
 
         # Verify license is deleted
-        response = client.get(f"/licenses/{license_obj.LicenseId}")
-        assert response.status_code == 404
+        assert db_session.exec(select(Licenses).where(Licenses.LicenseId == 1)).first() is None
 
     def test_delete_license_not_found(self, client):
         """Test DELETE /licenses/{license_id} returns 404 for non-existent license"""
@@ -172,27 +183,12 @@ class TestLicensesAPI:
         # Should return validation error
         assert response.status_code == 422
 
-    def _create_test_employee(self, db_session: Session) -> object:
-        """Helper method to create a test employee"""
-        from models.employees import Employees
-
-        employee = Employees(
-            Name="Test Employee",
-            Role="Developer",
-            Email="test@example.com",
-            EmployeeId=1
-        )
-        db_session.add(employee)
-        db_session.commit()
-        db_session.refresh(employee)
-        return employee
-
     def _create_test_license(self, db_session: Session, employee_id: int, software: str = "Visual Studio Code") -> Licenses:
         """Helper method to create a test license"""
         license_obj = Licenses(
             Software=software,
             Version="1.85.0",
-            ExpiryDate=date(2024, 12, 31),
+            ExpiryDate=_EXPIRY_DATE,
             Key="XXXXX-XXXXX-XXXXX-XXXXX-XXXXX",
             Account="license@company.com",
             Password="password123",
@@ -202,3 +198,21 @@ class TestLicensesAPI:
         db_session.commit()
         db_session.refresh(license_obj)
         return license_obj
+
+    def _seed(self, db_session: Session, licenses: list = ()) -> None:
+        """Helper method to insert test licenses with a single commit"""
+        db_session.add_all(licenses)
+        db_session.commit()
+
+    def _license(self, license_id: int, employee_id: int = 1, software: str = "Visual Studio Code") -> Licenses:
+        """Helper method to build an unsaved test license with a known id"""
+        return Licenses(
+            LicenseId=license_id,
+            Software=software,
+            Version="1.85.0",
+            ExpiryDate=_EXPIRY_DATE,
+            Key="XXXXX-XXXXX-XXXXX-XXXXX-XXXXX",
+            Account="license@company.com",
+            Password="password123",
+            EmployeeId=employee_id
+        )
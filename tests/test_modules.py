@@ -1,15 +1,18 @@
 import pytest
+from types import MappingProxyType
+from typing import Mapping
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from main import app
+from api.modules import get_modules
 from models.modules import Modules, RoleModules
 from models.employees import Roles
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_module_data():
-    """Sample module data for testing."""
-    return {
+    """Sample module data for testing (read-only, shared by all tests)."""
+    return MappingProxyType({
         "ModuleName": "Test Module",
         "ModuleKey": "test_module",
         "Description": "A test module",
@@ -18,7 +21,7 @@ def sample_module_data():
         "DisplayOrder": 99,
         "IsActive": True,
         "ParentModuleId": None
-    }
+    })
 
 @pytest.fixture
 def sample_permission_data():
@@ -35,25 +38,50 @@ def sample_permission_data():
         "OtherActions": False
     }
 
+
+def _seed_module(db_session: Session, **overrides) -> Modules:
+    """Insert a module directly and return it with its ModuleId."""
+    values = {
+        "ModuleName": "Test Module",
+        "ModuleKey": "test_module",
+        "Description": "A test module",
+        "Icon": "test_icon",
+        "RouteUrl": "/test",
+        "DisplayOrder": 99,
+        "IsActive": True,
+        "ParentModuleId": None,
+        **overrides,
+    }
+    module = Modules(**values)
+    db_session.add(module)
+    db_session.commit()
+    db_session.refresh(module)
+    return module
+
+@pytest.fixture
+def seeded_module(db_session: Session, sample_module_data: Mapping) -> Modules:
+    """Module row built from sample_module_data, inserted without going through the API."""
+    return _seed_module(db_session, **sample_module_data)
+
 class TestModules:
     """Test suite for Modules endpoints."""
 
-    def test_create_module(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_create_module(self, client: TestClient, auth_headers: dict, sample_module_data: Mapping):
         """Test creating a new module."""
-        response = client.post("/modules/", json=sample_module_data, headers=auth_headers)
+        response = client.post("/modules/", json=dict(sample_module_data), headers=auth_headers)
         assert response.status_code == 200
         data = response.json()
         assert data["ModuleName"] == sample_module_data["ModuleName"]
         assert data["ModuleKey"] == sample_module_data["ModuleKey"]
         assert "ModuleId" in data
 
-    def test_create_module_duplicate_key(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_create_module_duplicate_key(self, client: TestClient, db_session: Session, auth_headers: dict, sample_module_data: Mapping):
         """Test creating a module with duplicate key fails."""
         # Create first module
-        client.post("/modules/", json=sample_module_data, headers=auth_headers)
+        _seed_module(db_session)
         
         # Try to create duplicate
-        response = client.post("/modules/", json=sample_module_data, headers=auth_headers)
+        response = client.post("/modules/", json=dict(sample_module_data), headers=auth_headers)
         assert response.status_code == 400
         assert "already exists" in response.json()["detail"]
 
@@ -64,11 +92,14 @@ class TestModules:
         data = response.json()
         assert isinstance(data, list)
 
-    def test_get_module_by_id(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_get_modules_handler(self, db_session: Session):
+        """Test the get-all-modules handler query on its own, without routing or serialization."""
+        data = get_modules(include_inactive=False, db=db_session, current_user={})
+        assert isinstance(data, list)
+
+    def test_get_module_by_id(self, client: TestClient, auth_headers: dict, seeded_module: Modules, sample_module_data: Mapping):
         """Test getting a specific module by ID."""
-        # Create module
-        create_response = client.post("/modules/", json=sample_module_data, headers=auth_headers)
-        module_id = create_response.json()["ModuleId"]
+        module_id = seeded_module.ModuleId
         
         # Get module
         response = client.get(f"/modules/{module_id}", headers=auth_headers)
@@ -77,11 +108,8 @@ class TestModules:
         assert data["ModuleId"] == module_id
         assert data["ModuleName"] == sample_module_data["ModuleName"]
 
-    def test_get_module_by_key(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_get_module_by_key(self, client: TestClient, auth_headers: dict, seeded_module: Modules, sample_module_data: Mapping):
         """Test getting a specific module by key."""
-        # Create module
-        client.post("/modules/", json=sample_module_data, headers=auth_headers)
-        
         # Get module by key
         response = client.get(f"/modules/by-key/{sample_module_data['ModuleKey']}", headers=auth_headers)
         assert response.status_code == 200
@@ -98,11 +126,21 @@ class TestModules:
         for module in data:
             assert module["ParentModuleId"] is None
 
-    def test_update_module(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_get_module_tree(self, client: TestClient, db_session: Session, auth_headers: dict):
+        """Test getting the module hierarchy as a tree."""
+        # Create parent and child modules
+        parent_id = _seed_module(db_session).ModuleId
+        _seed_module(db_session, ModuleKey="child_module", ParentModuleId=parent_id)
+
+        response = client.get("/modules/tree/all", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        parent = next(module for module in data if module["ModuleId"] == parent_id)
+        assert [child["ModuleKey"] for child in parent["children"]] == ["child_module"]
+
+    def test_update_module(self, client: TestClient, auth_headers: dict, seeded_module: Modules):
         """Test updating a module."""
-        # Create module
-        create_response = client.post("/modules/", json=sample_module_data, headers=auth_headers)
-        module_id = create_response.json()["ModuleId"]
+        module_id = seeded_module.ModuleId
         
         # Update module
         update_data = {"ModuleName": "Updated Module Name"}
@@ -111,12 +149,10 @@ class TestModules:
         data = response.json()
         assert data["ModuleName"] == "Updated Module Name"
 
-    def test_toggle_module_active(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_toggle_module_active(self, client: TestClient, auth_headers: dict, seeded_module: Modules):
         """Test toggling module active status."""
-        # Create module
-        create_response = client.post("/modules/", json=sample_module_data, headers=auth_headers)
-        module_id = create_response.json()["ModuleId"]
-        original_status = create_response.json()["IsActive"]
+        module_id = seeded_module.ModuleId
+        original_status = seeded_module.IsActive
         
         # Toggle status
         response = client.patch(f"/modules/{module_id}/toggle-active", headers=auth_headers)
@@ -124,29 +160,24 @@ class TestModules:
         data = response.json()
         assert data["IsActive"] != original_status
 
-    def test_delete_module(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_delete_module(self, client: TestClient, db_session: Session, auth_headers: dict, seeded_module: Modules):
         """Test deleting a module."""
-        # Create module
-        create_response = client.post("/modules/", json=sample_module_data, headers=auth_headers)
-        module_id = create_response.json()["ModuleId"]
+        module_id = seeded_module.ModuleId
         
         # Delete module
         response = client.delete(f"/modules/{module_id}", headers=auth_headers)
         assert response.status_code == 200
         
         # Verify deletion
-        get_response = client.get(f"/modules/{module_id}", headers=auth_headers)
-        assert get_response.status_code == 404
+        assert db_session.exec(select(Modules).where(Modules.ModuleId == module_id)).first() is None
 
-    def test_delete_module_with_children_fails(self, client: TestClient, auth_headers: dict, sample_module_data: dict):
+    def test_delete_module_with_children_fails(self, client: TestClient, db_session: Session, auth_headers: dict):
         """Test that deleting a module with children fails."""
         # Create parent module
-        parent_response = client.post("/modules/", json=sample_module_data, headers=auth_headers)
-        parent_id = parent_response.json()["ModuleId"]
+        parent_id = _seed_module(db_session).ModuleId
         
         # Create child module
-        child_data = {**sample_module_data, "ModuleKey": "child_module", "ParentModuleId": parent_id}
-        client.post("/modules/", json=child_data, headers=auth_headers)
+        _seed_module(db_session, ModuleKey="child_module", ParentModuleId=parent_id)
         
         # Try to delete parent
         response = client.delete(f"/modules/{parent_id}", headers=auth_headers)
@@ -173,11 +204,24 @@ class TestPermissions:
         data = response.json()
         assert isinstance(data, list)
 
-    def test_get_role_permissions(self, client: TestClient, auth_headers: dict):
-        """Test getting permissions for a specific role."""
+    def test_get_role_permissions(self, client: TestClient, db_session: Session, auth_headers: dict, sql_statements: list):
+        """Test getting permissions for a specific role without per-module queries."""
         role_id = 1  # Admin role
+        db_session.add(Roles(RoleId=role_id, RoleName="Admin"))
+        modules = [
+            _seed_module(db_session, ModuleKey=f"module_{index}", DisplayOrder=index)
+            for index in range(5)
+        ]
+        db_session.add_all(RoleModules(RoleId=role_id, ModuleId=module.ModuleId) for module in modules)
+        db_session.commit()
+
+        sql_statements.clear()
         response = client.get(f"/permissions/role/{role_id}", headers=auth_headers)
         assert response.status_code == 200
+
+        # Role lookup + one joined permissions query, regardless of the number of modules
+        selects = [statement for statement in sql_statements if statement.lstrip().upper().startswith("SELECT")]
+        assert len(selects) <= 2
         data = response.json()
         assert data["RoleId"] == role_id
         assert "RoleName" in data
@@ -213,10 +257,15 @@ class TestPermissions:
         data = response.json()
         assert data["CanDelete"] == False
 
-    def test_delete_permission(self, client: TestClient, auth_headers: dict, sample_permission_data: dict):
+    def test_delete_permission(self, client: TestClient, db_session: Session, auth_headers: dict, sample_permission_data: dict):
         """Test deleting a permission."""
+        # Role and module the sample permission points at
+        db_session.add(Roles(RoleId=sample_permission_data["RoleId"], RoleName="Admin"))
+        _seed_module(db_session, ModuleId=sample_permission_data["ModuleId"])
+
         # Create permission
         create_response = client.post("/permissions/", json=sample_permission_data, headers=auth_headers)
+        assert create_response.status_code == 200
         role_id = create_response.json()["RoleId"]
         module_id = create_response.json()["ModuleId"]
         
@@ -225,45 +274,43 @@ class TestPermissions:
         assert response.status_code == 200
         
         # Verify deletion
-        get_response = client.get(f"/permissions/{role_id}/{module_id}", headers=auth_headers)
-        assert get_response.status_code == 404
+        assert db_session.exec(
+            select(RoleModules).where(RoleModules.RoleId == role_id, RoleModules.ModuleId == module_id)
+        ).first() is None
 
-    def test_bulk_update_permissions(self, client: TestClient, auth_headers: dict):
+    def test_bulk_update_permissions(self, client: TestClient, db_session: Session, auth_headers: dict):
         """Test bulk updating permissions for a role."""
+        role_id = 3  # User role
+        db_session.add(Roles(RoleId=role_id, RoleName="User"))
+        for module_id in (1, 2, 3):
+            _seed_module(db_session, ModuleId=module_id, ModuleKey=f"module_{module_id}")
+        # Module 3 is not in the request, so its permission must go
+        db_session.add(RoleModules(RoleId=role_id, ModuleId=3))
+        db_session.commit()
+
+        no_access = {"CanCreate": False, "CanEdit": False, "CanDelete": False, "CanExport": False, "AdminActions": False, "OtherActions": False}
         bulk_data = {
-            "RoleId": 3,  # User role
+            "RoleId": role_id,
             "permissions": [
-                {
-                    "RoleId": 3,
-                    "ModuleId": 1,
-                    "CanView": True,
-                    "CanCreate": False,
-                    "CanEdit": False,
-                    "CanDelete": False,
-                    "CanExport": False,
-                    "AdminActions": False,
-                    "OtherActions": False
-                },
-                {
-                    "RoleId": 3,
-                    "ModuleId": 2,
-                    "CanView": True,
-                    "CanCreate": False,
-                    "CanEdit": False,
-                    "CanDelete": False,
-                    "CanExport": False,
-                    "AdminActions": False,
-                    "OtherActions": False
-                }
+                {"RoleId": role_id, "ModuleId": 1, "CanView": True, **no_access},
+                {"RoleId": role_id, "ModuleId": 2, "CanView": True, **no_access},
+                # Same module twice: the last entry wins instead of a duplicate-key error
+                {"RoleId": role_id, "ModuleId": 2, "CanView": False, **no_access},
+                # The request's RoleId applies to every entry
+                {"RoleId": 1, "ModuleId": 1, "CanView": True, **no_access}
             ]
         }
         
         response = client.post("/permissions/bulk-update", json=bulk_data, headers=auth_headers)
         assert response.status_code == 200
         data = response.json()
-        assert data["RoleId"] == 3
+        assert data["RoleId"] == role_id
         assert len(data["permissions"]) == 2
 
+        db_session.expire_all()
+        rows = db_session.exec(select(RoleModules).order_by(RoleModules.RoleId, RoleModules.ModuleId)).all()
+        assert [(row.RoleId, row.ModuleId, row.CanView) for row in rows] == [(role_id, 1, True), (role_id, 2, False)]
+
     def test_check_user_permission(self, client: TestClient, auth_headers: dict):
         """Test checking user permission."""
         response = client.get("/permissions/check/dashboard/view", headers=auth_headers)